@@ -0,0 +1,34 @@
+import random
+import string
+import sys
+from typing import Iterator
+
+LINES = 100
+WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+# Time grows with the length of each line, not the number of lines
+COMPLEXITY = "n"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """100 lines of `scale` characters mixing letters, digits and spelled out digits"""
+    for _ in range(LINES):
+        chunks = [rng.choice(string.digits)]
+        length = 1
+
+        while length < scale:
+            roll = rng.random()
+            chunks.append(
+                rng.choice(string.digits) if roll < 0.05
+                else rng.choice(WORDS) if roll < 0.15
+                else rng.choice(string.ascii_lowercase)
+            )
+            length += len(chunks[-1])
+
+        rng.shuffle(chunks)
+        yield "".join(chunks) + "\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
@@ -1,3 +1,10 @@
+from io import TextIOWrapper
+
+
+def parse(file: TextIOWrapper) -> list[str]:
+    return file.readlines()
+
+
 def part1(lines : list[str]) -> int:
     sum = 0
 
@@ -65,7 +72,7 @@ def part2(lines : list[str]) -> int:
 
 if __name__ == "__main__":
     with open("input.txt") as file:
-        lines = file.readlines()
+        lines = parse(file)
 
         print(part1(lines))
         print(part2(lines))
@@ -2,6 +2,9 @@ from collections import defaultdict
 from enum import IntEnum
 from io import TextIOWrapper
 
+from aoc.directions import DELTAS, DIRECTIONS_BY_DELTA, RIGHT, TURN_LEFT, TURN_RIGHT
+from aoc.grid import Grid
+
 
 class Direction(IntEnum):
     NORTH = 0b1000
@@ -9,14 +12,6 @@ class Direction(IntEnum):
     EAST = 0b0010
     WEST = 0b0001
 
-    NORTHEAST = 0b1010
-    NORTHSOUTH = 0b1100
-    NORTHWEST = 0b1001
-
-    SOUTHEAST = 0b0110
-    SOUTHWEST = 0b0101
-    
-
 
 SYMBOL_TO_PIPE_DIRS = {
     "|": Direction.NORTH | Direction.SOUTH,
@@ -28,23 +23,19 @@ SYMBOL_TO_PIPE_DIRS = {
     ".": 0b0000,
 }
 
-PIPE_DIRS_TO_SYMBOLS = {dirs: symbol for symbol, dirs in SYMBOL_TO_PIPE_DIRS.items()}
+# The start tile has no pipe directions until calculate_start figures them out
+SYMBOLS_TO_PIPE_DIRS_TABLE = bytes.maketrans(
+    "".join(SYMBOL_TO_PIPE_DIRS).encode() + b"S", bytes(SYMBOL_TO_PIPE_DIRS.values()) + b"\0"
+)
 
 Coord = tuple[int, int]
-Map = dict[Coord, int]
+Map = Grid
 
 def parse_map(file: TextIOWrapper) -> tuple[Map, Coord]:
-    result = {}
-    start = None
-    rows, cols = 0, 0
-
-    for row, line in enumerate(file):
-        for col, symbol in enumerate(line.strip()):
-            cols += 1
-            if symbol == "S":
-                start = (col, row)
-            else:
-                result[(col, row)] = SYMBOL_TO_PIPE_DIRS[symbol]
+    # Transposed so the grid is indexed by (col, row) like every coord in this day
+    result = Grid.parse(file).transpose()
+    start = next(result.find(ord("S")), None)
+    result.cells = result.cells.translate(SYMBOLS_TO_PIPE_DIRS_TABLE)
 
     assert start is not None
     return result, start
@@ -142,269 +133,31 @@ def calculate_start(loop: list[Coord]) -> int:
             raise NotImplementedError(adj)
 
 
-def get_loop_positive_tiles(loop: list[Coord], map: Map) -> set[Coord]:
-    min_pipe = min(loop)
-    min_pipe_index = loop.index(min_pipe)
+def get_loop_positive_tiles(loop: list[Coord]) -> set[Coord]:
+    """The tiles next to the loop on its inside, found by walking it.
+
+    The smallest coord is the loop's top-left corner, an F, so the inside is
+    on the right when the walk leaves it going east and on the left when it
+    leaves going south. Every other pipe looks to that side of the directions
+    it is entered and left in; inner corners only see the loop itself.
+    """
+    min_pipe_index = loop.index(min(loop))
+    walk = loop[min_pipe_index:] + loop[:min_pipe_index + 1]
 
-    pos_dir = Direction.SOUTHEAST
+    # Coords are (col, row) here while the direction tables are (row, col)
+    headings = [DIRECTIONS_BY_DELTA[(b[1] - a[1], b[0] - a[0])] for a, b in zip(walk, walk[1:])]
+    inside = TURN_RIGHT if headings[0] == RIGHT else TURN_LEFT
     pos_coords = set[Coord]()
-    last_pipe_value = map[min_pipe]
-
-    for pipe in loop[min_pipe_index + 1:] + loop[:min_pipe_index]:
-        match pos_dir:
-            case Direction.NORTH:
-                if last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_dir = Direction.NORTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                else:
-                    raise NotImplementedError((PIPE_DIRS_TO_SYMBOLS[last_pipe_value], PIPE_DIRS_TO_SYMBOLS[map[pipe]]))
-            case Direction.SOUTH:
-                if last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_dir = Direction.SOUTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["-"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                else:
-                    raise NotImplementedError((PIPE_DIRS_TO_SYMBOLS[last_pipe_value], PIPE_DIRS_TO_SYMBOLS[map[pipe]]))
-            case Direction.EAST:
-                if last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.EAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                else:
-                    raise NotImplementedError((PIPE_DIRS_TO_SYMBOLS[last_pipe_value], PIPE_DIRS_TO_SYMBOLS[map[pipe]]))
-            case Direction.WEST:
-                if last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.WEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["|"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                else:
-                    raise NotImplementedError((PIPE_DIRS_TO_SYMBOLS[last_pipe_value], PIPE_DIRS_TO_SYMBOLS[map[pipe]]))
-            case Direction.SOUTHEAST:
-                if last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.EAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_dir = Direction.SOUTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.EAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_dir = Direction.SOUTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                else:
-                    raise NotImplementedError((PIPE_DIRS_TO_SYMBOLS[last_pipe_value], PIPE_DIRS_TO_SYMBOLS[map[pipe]]))
-            case Direction.SOUTHWEST:
-                if last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_dir = Direction.SOUTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.WEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.WEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_dir = Direction.SOUTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                else:
-                    raise NotImplementedError((PIPE_DIRS_TO_SYMBOLS[last_pipe_value], PIPE_DIRS_TO_SYMBOLS[map[pipe]]))
-            case Direction.NORTHEAST:
-                if last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_dir = Direction.NORTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.EAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_dir = Direction.NORTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.EAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["7"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.SOUTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["L"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                else:
-                    raise NotImplementedError((PIPE_DIRS_TO_SYMBOLS[last_pipe_value], PIPE_DIRS_TO_SYMBOLS[map[pipe]]))
-            case Direction.NORTHWEST:
-                if last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.WEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_dir = Direction.NORTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["F"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["L"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["|"]:
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.WEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["J"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.NORTHWEST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["-"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_dir = Direction.NORTH
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["F"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] - 1))
-                    pos_coords.add((pipe[0] + 1, pipe[1]))
-                    pos_dir = Direction.NORTHEAST
-                elif last_pipe_value == SYMBOL_TO_PIPE_DIRS["J"] and map[pipe] == SYMBOL_TO_PIPE_DIRS["7"]:
-                    pos_coords.add((pipe[0], pipe[1] + 1))
-                    pos_coords.add((pipe[0] - 1, pipe[1]))
-                    pos_dir = Direction.SOUTHWEST
-                else:
-                    raise NotImplementedError((PIPE_DIRS_TO_SYMBOLS[last_pipe_value], PIPE_DIRS_TO_SYMBOLS[map[pipe]]))
-            case dir:
-                raise NotImplementedError(dir)
-            
-        last_pipe_value = map[pipe]
+
+    for pipe, heading_in, heading_out in zip(walk[1:], headings, headings[1:]):
+        for side in (inside[heading_in], inside[heading_out]):
+            row_offset, col_offset = DELTAS[side]
+            pos_coords.add((pipe[0] + col_offset, pipe[1] + row_offset))
 
     return pos_coords
 
 def get_loop_num_enclosed_tiles(loop: list[Coord], map: Map) -> set[Coord]:
-    pos_coords = {coord for coord in get_loop_positive_tiles(loop, map) if coord in map and coord not in loop}
+    pos_coords = {coord for coord in get_loop_positive_tiles(loop) if coord in map and coord not in loop}
     enclosed_tiles = set(pos_coords)
     loop = set(loop)
 
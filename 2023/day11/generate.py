@@ -0,0 +1,26 @@
+import random
+import sys
+from typing import Iterator
+
+GALAXY_CHANCE = 0.02
+EMPTY_CHANCE = 0.05
+
+# Linear in the pixels of the image
+COMPLEXITY = "n^2"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """A `scale` x `scale` image of galaxies with some rows and columns left empty"""
+    empty_columns = {col for col in range(scale) if rng.random() < EMPTY_CHANCE}
+
+    for _ in range(scale):
+        empty_row = rng.random() < EMPTY_CHANCE
+        yield "".join(
+            "#" if not empty_row and col not in empty_columns and rng.random() < GALAXY_CHANCE else "."
+            for col in range(scale)
+        ) + "\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
@@ -1,5 +1,9 @@
 from collections import defaultdict
 from io import TextIOWrapper
+from types import ModuleType
+from typing import Any
+
+from aoc.backends import numpy
 
 Coord = tuple[int, int]
 
@@ -51,9 +55,47 @@ def calculate(file, expansion_factor: int) -> int:
 
     return sum(distances.values())
 
+
+def distance_sum_numpy(np: ModuleType, coords: Any) -> int:
+    # Once sorted, the i-th of n coordinates is added for the i pairs with
+    # one before it and subtracted for the n - 1 - i with one after it
+    coords = np.sort(coords)
+    weights = 2 * np.arange(len(coords), dtype=np.int64) - len(coords) + 1
+
+    # Summed as Python ints, since the total of a big image overflows an int64
+    return sum((coords * weights).tolist())
+
+
+def calculate_numpy(np: ModuleType, file: TextIOWrapper, expansion_factor: int) -> int:
+    lines = [line.strip().encode() for line in file]
+    image = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(len(lines), -1) == ord("#")
+    rows, cols = np.nonzero(image)
+
+    # Every empty row or column before a galaxy moves it expansion_factor - 1 further
+    rows = rows + (expansion_factor - 1) * np.cumsum(~image.any(axis=1))[rows]
+    cols = cols + (expansion_factor - 1) * np.cumsum(~image.any(axis=0))[cols]
+
+    # Distances are Manhattan, so rows and columns add up separately
+    return distance_sum_numpy(np, rows) + distance_sum_numpy(np, cols)
+
+
+def part1(file: TextIOWrapper) -> int:
+    if (np := numpy()) is not None:
+        return calculate_numpy(np, file, expansion_factor=2)
+
+    return calculate(file, expansion_factor=2)
+
+
+def part2(file: TextIOWrapper) -> int:
+    if (np := numpy()) is not None:
+        return calculate_numpy(np, file, expansion_factor=1000000)
+
+    return calculate(file, expansion_factor=1000000)
+
+
 if __name__ == "__main__":
     with open("input.txt") as file:
-        print(calculate(file, expansion_factor=2))
+        print(part1(file))
 
     with open("input.txt") as file:
-        print(calculate(file, expansion_factor=1000000))
\ No newline at end of file
+        print(part2(file))
@@ -3,7 +3,7 @@ from io import TextIOWrapper
 from typing import Optional
 
 
-def parse_patterns(file: TextIOWrapper) -> list[tuple[list[str], list[str]]]:
+def parse(file: TextIOWrapper) -> list[tuple[list[str], list[str]]]:
     patterns = list[tuple[list[str], list[str]]]()
     
     current_rows = list[str]()
@@ -112,6 +112,6 @@ def part1and2(patterns: list[tuple[list[str], list[str]]]) -> int:
 
 if __name__ == "__main__":
     with open("input.txt") as file:
-        patterns = parse_patterns(file)
+        patterns = parse(file)
 
     print(part1and2(patterns))
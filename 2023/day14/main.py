@@ -1,178 +1,150 @@
 from io import TextIOWrapper
 
+from aoc.grid import Grid
 
-def parse_map(file: TextIOWrapper) -> tuple[dict[tuple[int, int], str], str, tuple[int, int]]:
-    map = dict[tuple[int, int], str]()
-    map_as_str = ""
+ROUND, CUBE, EMPTY = ord("O"), ord("#"), ord(".")
 
-    for row, line in enumerate(file):
-        line = line.strip()
-        map_as_str += line
 
-        for col, char in enumerate(line):
-            map[(row, col)] = char
+def parse(file: TextIOWrapper) -> Grid:
+    return Grid.parse(file).freeze()
 
-    max_row, max_col = max(map)
-    return map, map_as_str, (max_row + 1, max_col + 1)
 
+def tilt_north(map: Grid) -> None:
+    num_rows, num_cols, cells = map.height, map.width, map.cells
+    assert isinstance(cells, bytearray), "Frozen grids can't be tilted"
 
-def map_to_str(map: dict[tuple[int, int], str], num_rows: int, num_cols: int) -> str:
-    result = ""
-    
-    for row in range(num_rows):
-        for col in range(num_cols):
-            result += map[(row, col)]
-
-    return result
-
-
-def tilt_north(map: dict[tuple[int, int], str], num_rows: int, num_cols: int) -> int:
     for col in range(num_cols):
         next_open_slots = list[int]()
 
         for row in range(num_rows):
-            c = map[(row, col)]
+            c = cells[row * num_cols + col]
 
-            if c == ".":
+            if c == EMPTY:
                 next_open_slots.append(row)
-            elif c == "O":
+            elif c == ROUND:
                 if len(next_open_slots) != 0:
                     next_open_slot = next_open_slots.pop(0)
-                    map[(next_open_slot, col)] = "O"
-                    map[(row, col)] = "."
+                    cells[next_open_slot * num_cols + col] = ROUND
+                    cells[row * num_cols + col] = EMPTY
                     next_open_slots.append(row)
-            elif c == "#":
+            elif c == CUBE:
                 next_open_slots = []
 
 
-def tilt_west(map: dict[tuple[int, int], str], num_rows: int, num_cols: int):
+def tilt_west(map: Grid):
+    num_rows, num_cols, cells = map.height, map.width, map.cells
+    assert isinstance(cells, bytearray), "Frozen grids can't be tilted"
+
     for row in range(num_rows):
         next_open_slots = list[int]()
 
         for col in range(num_cols):
-            match map[(row, col)]:
-                case ".":
-                    next_open_slots.append(col)
-                case "O" if len(next_open_slots) != 0:
+            c = cells[row * num_cols + col]
+
+            if c == EMPTY:
+                next_open_slots.append(col)
+            elif c == ROUND:
+                if len(next_open_slots) != 0:
                     next_open_slot = next_open_slots.pop(0)
-                    map[(row, next_open_slot)] = "O"
-                    map[(row, col)] = "."
+                    cells[row * num_cols + next_open_slot] = ROUND
+                    cells[row * num_cols + col] = EMPTY
                     next_open_slots.append(col)
-                case "#":
-                    next_open_slots = []
-                case "O":
-                    pass
-                case c:
-                    raise RuntimeError(c)
+            elif c == CUBE:
+                next_open_slots = []
+            else:
+                raise RuntimeError(chr(c))
                 
 
-def tilt_south(map: dict[tuple[int, int], str], num_rows: int, num_cols: int):
+def tilt_south(map: Grid):
+    num_rows, num_cols, cells = map.height, map.width, map.cells
+    assert isinstance(cells, bytearray), "Frozen grids can't be tilted"
+
     for col in range(num_cols - 1, -1, -1):
         next_open_slots = list[int]()
 
         for row in range(num_rows - 1, -1, -1):
-            match map[(row, col)]:
-                case ".":
-                    next_open_slots.append(row)
-                case "O" if len(next_open_slots) != 0:
+            c = cells[row * num_cols + col]
+
+            if c == EMPTY:
+                next_open_slots.append(row)
+            elif c == ROUND:
+                if len(next_open_slots) != 0:
                     next_open_slot = next_open_slots.pop(0)
-                    map[(next_open_slot, col)] = "O"
-                    map[(row, col)] = "."
+                    cells[next_open_slot * num_cols + col] = ROUND
+                    cells[row * num_cols + col] = EMPTY
                     next_open_slots.append(row)
-                case "#":
-                    next_open_slots = []
-                case "O":
-                    pass
-                case c:
-                    raise RuntimeError(c)
+            elif c == CUBE:
+                next_open_slots = []
+            else:
+                raise RuntimeError(chr(c))
+
 
+def tilt_east(map: Grid):
+    num_rows, num_cols, cells = map.height, map.width, map.cells
+    assert isinstance(cells, bytearray), "Frozen grids can't be tilted"
 
-def tilt_east(map: dict[tuple[int, int], str], num_rows: int, num_cols: int):
     for row in range(num_rows - 1, -1, -1):
         next_open_slots = list[int]()
 
         for col in range(num_cols - 1, -1, -1):
-            match map[(row, col)]:
-                case ".":
-                    next_open_slots.append(col)
-                case "O" if len(next_open_slots) != 0:
+            c = cells[row * num_cols + col]
+
+            if c == EMPTY:
+                next_open_slots.append(col)
+            elif c == ROUND:
+                if len(next_open_slots) != 0:
                     next_open_slot = next_open_slots.pop(0)
-                    map[(row, next_open_slot)] = "O"
-                    map[(row, col)] = "."
+                    cells[row * num_cols + next_open_slot] = ROUND
+                    cells[row * num_cols + col] = EMPTY
                     next_open_slots.append(col)
-                case "#":
-                    next_open_slots = []
-                case "O":
-                    pass
-                case c:
-                    raise RuntimeError(c)
+            elif c == CUBE:
+                next_open_slots = []
+            else:
+                raise RuntimeError(chr(c))
 
 
-def get_north_support(map: dict[tuple[int, int], str], num_rows: int, num_cols: int) -> int:
-    result = 0
-    
-    for row in range(num_rows):
-        for col in range(num_cols):
-            if map[(row, col)] == "O":
-                result += num_rows - row
+def get_north_support(map: Grid) -> int:
+    return sum(map.height - row for row, _ in map.find(ROUND))
 
-    return result
 
-
-def execute_cycle(map: dict[tuple[int, int], str], num_rows: int, num_cols: int, maps: set[str]) -> bool:
+def execute_cycle(map: Grid, maps: set[bytes]) -> bool:
     seen = False
 
-    tilt_north(map, num_rows, num_cols)
-    if (map_as_str := map_to_str(map, num_rows, num_cols)) not in maps:
-        maps.add(map_as_str)
-    else:
-        seen = True
-
-    tilt_west(map, num_rows, num_cols)
-    if (map_as_str := map_to_str(map, num_rows, num_cols)) not in maps:
-        maps.add(map_as_str)
-    else:
-        seen = True
-
-    tilt_south(map, num_rows, num_cols)
-    if (map_as_str := map_to_str(map, num_rows, num_cols)) not in maps:
-        maps.add(map_as_str)
-    else:
-        seen = True
-
-    tilt_east(map, num_rows, num_cols)
-    if (map_as_str := map_to_str(map, num_rows, num_cols)) not in maps:
-        maps.add(map_as_str)
-    else:
-        seen = True
+    for tilt in (tilt_north, tilt_west, tilt_south, tilt_east):
+        tilt(map)
+
+        if (snapshot := map.snapshot()) not in maps:
+            maps.add(snapshot)
+        else:
+            seen = True
     
     return seen
 
 
-def part1(file: TextIOWrapper) -> int:
-    map, _, (num_rows, num_cols) = parse_map(file)
-    tilt_north(map, num_rows, num_cols)
+def part1(platform: Grid) -> int:
+    map = platform.copy()
+    tilt_north(map)
 
-    return get_north_support(map, num_rows, num_cols)
+    return get_north_support(map)
 
 
-def part2(file: TextIOWrapper) -> int:
-    map, map_as_str, (num_rows, num_cols) = parse_map(file)
-    maps = {map_as_str}
+def part2(platform: Grid) -> int:
+    map = platform.copy()
+    maps = {map.snapshot()}
 
     for cycle in range(1_000_000_000):
-        if execute_cycle(map, num_rows, num_cols, maps):
+        if execute_cycle(map, maps):
             for _ in range(1_000_000_000 % cycle + 2):
-                execute_cycle(map, num_rows, num_cols, maps)
+                execute_cycle(map, maps)
 
             break
 
-    return get_north_support(map, num_rows, num_cols)
+    return get_north_support(map)
 
 
 if __name__ == "__main__":
     with open("input.txt") as file:
-        print(part1(file))
+        platform = parse(file)
 
-    with open("input.txt") as file:
-        print(part2(file))
+    print(part1(platform))
+    print(part2(platform))
@@ -1,94 +1,44 @@
-from enum import Enum, auto
 from io import TextIOWrapper
 
+from aoc.counters import counters
+from aoc.directions import DOWN, LEFT, RIGHT, UP, Direction, transitions
+from aoc.grid import Grid
+from aoc.parallel import fan_out
 
-def parse_map(file: TextIOWrapper) -> dict[tuple[int, int], str]:
-    map = dict[tuple[int, int], str]()
 
-    for row, line in enumerate(file):
-        for col, tile in enumerate(line.strip()):
-            map[(row, col)] = tile
+def parse(file: TextIOWrapper) -> Grid:
+    return Grid.parse(file)
 
-    return map
 
+# The directions a beam leaves a tile in, for each direction it entered in
+DEFLECTIONS: dict[str, tuple[tuple[Direction, ...], ...]] = {
+    ".": ((UP,), (RIGHT,), (DOWN,), (LEFT,)),
+    "/": ((RIGHT,), (UP,), (LEFT,), (DOWN,)),
+    "\\": ((LEFT,), (DOWN,), (RIGHT,), (UP,)),
+    "|": ((UP,), (UP, DOWN), (DOWN,), (UP, DOWN)),
+    "-": ((RIGHT, LEFT), (RIGHT,), (RIGHT, LEFT), (LEFT,)),
+}
 
-class Direction(Enum):
-    NORTH = auto()
-    SOUTH = auto()
-    EAST = auto()
-    WEST = auto()
-
+MOVES = transitions(DEFLECTIONS)
 
 Beam = tuple[tuple[int, int], Direction]
 
 
-def move_beam(beam: Beam, map: dict[tuple[int, int], str]) -> list[Beam]:
+def move_beam(beam: Beam, map: Grid) -> list[Beam]:
     beam_pos, beam_direction = beam
     beam_row, beam_col = beam_pos
 
-    match map[beam_pos], beam_direction:
-        case ".", Direction.NORTH:
-            return [((beam_row - 1, beam_col), Direction.NORTH)]
-        case ".", Direction.SOUTH:
-            return [((beam_row + 1, beam_col), Direction.SOUTH)]
-        case ".", Direction.EAST:
-            return [((beam_row, beam_col + 1), Direction.EAST)]
-        case ".", Direction.WEST:
-            return [((beam_row, beam_col - 1), Direction.WEST)]
-        case "/", Direction.NORTH:
-            return [((beam_row, beam_col + 1), Direction.EAST)]
-        case "/", Direction.SOUTH:
-            return [((beam_row, beam_col - 1), Direction.WEST)]
-        case "/", Direction.EAST:
-            return [((beam_row - 1, beam_col), Direction.NORTH)]
-        case "/", Direction.WEST:
-            return [((beam_row + 1, beam_col), Direction.SOUTH)]
-        case "\\", Direction.NORTH:
-            return [((beam_row, beam_col - 1), Direction.WEST)]
-        case "\\", Direction.SOUTH:
-            return [((beam_row, beam_col + 1), Direction.EAST)]
-        case "\\", Direction.EAST:
-            return [((beam_row + 1, beam_col), Direction.SOUTH)]
-        case "\\", Direction.WEST:
-            return [((beam_row - 1, beam_col), Direction.NORTH)]
-        case "|", Direction.NORTH:
-            return [((beam_row - 1, beam_col), Direction.NORTH)]
-        case "|", Direction.SOUTH:
-            return [((beam_row + 1, beam_col), Direction.SOUTH)]
-        case "|", Direction.EAST:
-            return [
-                ((beam_row - 1, beam_col), Direction.NORTH),
-                ((beam_row + 1, beam_col), Direction.SOUTH),
-            ]
-        case "|", Direction.WEST:
-            return [
-                ((beam_row - 1, beam_col), Direction.NORTH),
-                ((beam_row + 1, beam_col), Direction.SOUTH),
-            ]
-        case "-", Direction.NORTH:
-            return [
-                ((beam_row, beam_col + 1), Direction.EAST),
-                ((beam_row, beam_col - 1), Direction.WEST),
-            ]
-        case "-", Direction.SOUTH:
-            return [
-                ((beam_row, beam_col + 1), Direction.EAST),
-                ((beam_row, beam_col - 1), Direction.WEST),
-            ]
-        case "-", Direction.EAST:
-            return [((beam_row, beam_col + 1), Direction.EAST)]
-        case "-", Direction.WEST:
-            return [((beam_row, beam_col - 1), Direction.WEST)]
-        case tile, dir:
-            raise RuntimeError((tile, dir))
-
-
-def find_num_energized_tiles(map: dict[tuple[int, int], str], initial_beam: Beam) -> int:
-    initial_beam_pos, _ = initial_beam
+    return [
+        ((beam_row + row_offset, beam_col + col_offset), direction)
+        for row_offset, col_offset, direction in MOVES[map[beam_pos]][beam_direction]
+    ]
+
 
+def find_num_energized_tiles(map: Grid, initial_beam: Beam) -> int:
     beams = {initial_beam}
-    seen = {initial_beam_pos}
+    seen = set[Beam]()
     energized_tiles = set[tuple[int, int]]()
+    revisited = 0
 
     while beams:
         beam = beams.pop()
@@ -103,40 +53,38 @@ def find_num_energized_tiles(map: dict[tuple[int, int], str], initial_beam: Beam
                 new_beam_pos, _ = new_beam
                 if new_beam_pos in map:
                     beams.add(new_beam)
-                    
+        else:
+            revisited += 1
+
+    # Every beam in seen was expanded exactly once
+    counts = counters()
+    counts["beams expanded"] += len(seen)
+    counts["beams revisited"] += revisited
 
     return len(energized_tiles)
 
 
-def part1(map: dict[tuple[int, int], str]) -> int:
-    return find_num_energized_tiles(map, ((0, 0), Direction.EAST))
+def part1(map: Grid) -> int:
+    return find_num_energized_tiles(map, ((0, 0), RIGHT))
 
 
-def part2(map: dict[tuple[int, int], str]) -> int:
-    num_rows, num_cols = max(map)
+def part2(map: Grid) -> int:
+    num_rows, num_cols = map.height - 1, map.width - 1
 
-    max_num_energized_tiles = 0
+    initial_beams = list[Beam]()
 
     for row in range(num_rows):
-        max_num_energized_tiles = max(
-            max_num_energized_tiles,
-            find_num_energized_tiles(map, ((row, 0), Direction.EAST)),
-            find_num_energized_tiles(map, ((row, num_cols - 1), Direction.WEST))
-        )
+        initial_beams += [((row, 0), RIGHT), ((row, num_cols - 1), LEFT)]
 
     for col in range(num_cols):
-        max_num_energized_tiles = max(
-            max_num_energized_tiles,
-            find_num_energized_tiles(map, ((0, col), Direction.SOUTH)),
-            find_num_energized_tiles(map, ((num_rows - 1, col), Direction.NORTH))
-        )
+        initial_beams += [((0, col), DOWN), ((num_rows - 1, col), UP)]
 
-    return max_num_energized_tiles
+    return max(fan_out(find_num_energized_tiles, map, initial_beams))
 
 
 if __name__ == "__main__":
     with open("input.txt") as file:
-        map = parse_map(file)
+        map = parse(file)
         
     print(part1(map))
     print(part2(map))
@@ -0,0 +1,17 @@
+import random
+import sys
+from typing import Iterator
+
+# A shortest path search over the n^2 blocks
+COMPLEXITY = "n^2 log n"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """A `scale` x `scale` grid of heat loss digits"""
+    for _ in range(scale):
+        yield "".join(rng.choices("123456789", k=scale)) + "\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
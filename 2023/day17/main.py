@@ -1,30 +1,20 @@
 from dataclasses import dataclass
-from enum import Enum, auto
 from io import TextIOWrapper
 from typing import Optional
 
+from aoc.counters import counters, high_water
+from aoc.directions import DELTAS, DOWN, RIGHT, TURN_LEFT, TURN_RIGHT, Direction
+from aoc.grid import DIGITS, Grid
 
-Map = dict[tuple[int, int], int]
 
+Map = Grid
 
-def parse_map(file: TextIOWrapper) -> Map:
-    map = Map()
 
-    for row, line in enumerate(file):
-        for col, block in enumerate(line.strip()):
-            map[(row, col)] = int(block)
+def parse(file: TextIOWrapper) -> Map:
+    return Grid.parse(file, DIGITS)
 
-    return map
 
-
-class Direction(Enum):
-    UP = auto()
-    DOWN = auto()
-    LEFT = auto()
-    RIGHT = auto()
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Crucible:
     position: tuple[int, int]
     direction: Direction
@@ -36,18 +26,9 @@ class Crucible:
         if self.remaining_movements_in_direction <= 0:
             return None
 
-        match self.direction:
-            case Direction.UP:
-                new_pos = (self.position[0] - 1, self.position[1])
-            case Direction.DOWN:
-                new_pos = (self.position[0] + 1, self.position[1])
-            case Direction.LEFT:
-                new_pos = (self.position[0], self.position[1] - 1)
-            case Direction.RIGHT:
-                new_pos = (self.position[0], self.position[1] + 1)
-            case dir:
-                raise RuntimeError(dir)
-            
+        row_offset, col_offset = DELTAS[self.direction]
+        new_pos = (self.position[0] + row_offset, self.position[1] + col_offset)
+
         if new_pos not in map:
             return None
 
@@ -68,37 +49,32 @@ class Crucible:
         else:
             amt = 3
 
-        match self.direction:
-            case Direction.UP | Direction.DOWN:
-                return [
-                    Crucible(self.position, Direction.LEFT, amt, self.heat_loss_total, self.is_ultra),
-                    Crucible(self.position, Direction.RIGHT, amt, self.heat_loss_total, self.is_ultra)
-                ]
-            case Direction.LEFT | Direction.RIGHT:
-                return [
-                    Crucible(self.position, Direction.UP, amt, self.heat_loss_total, self.is_ultra),
-                    Crucible(self.position, Direction.DOWN, amt, self.heat_loss_total, self.is_ultra)
-                ]
-            case dir:
-                raise RuntimeError(dir)
+        return [
+            Crucible(self.position, TURN_LEFT[self.direction], amt, self.heat_loss_total, self.is_ultra),
+            Crucible(self.position, TURN_RIGHT[self.direction], amt, self.heat_loss_total, self.is_ultra)
+        ]
 
 
 def part1(map: Map) -> int:
-    end = max(map)
+    end = (map.height - 1, map.width - 1)
 
     crucibles = {
-        Crucible((0, 0), Direction.RIGHT, 2, 0),
-        Crucible((0, 0), Direction.DOWN, 2, 0),
+        Crucible((0, 0), RIGHT, 2, 0),
+        Crucible((0, 0), DOWN, 2, 0),
     }
 
     seen : dict[tuple[tuple[int, int], Direction, int], int] = {}
     minimum_heat_loss = None
+    counts = counters()
+    expanded = pruned = 0
 
     while crucibles:
         new_crucibles = set[Crucible]()
+        high_water(counts, "queue high-water", len(crucibles))
 
         for crucible in crucibles:
             if minimum_heat_loss is not None and crucible.heat_loss_total > minimum_heat_loss:
+                pruned += 1
                 continue
 
             if crucible.position not in map:
@@ -106,8 +82,10 @@ def part1(map: Map) -> int:
 
             if (seen_heat_loss := seen.get((crucible.position, crucible.direction, crucible.remaining_movements_in_direction))) is not None:
                 if crucible.heat_loss_total >= seen_heat_loss:
+                    pruned += 1
                     continue
 
+            expanded += 1
             seen[(crucible.position, crucible.direction, crucible.remaining_movements_in_direction)] = crucible.heat_loss_total
 
             if crucible.position == end and (minimum_heat_loss is None or crucible.heat_loss_total < minimum_heat_loss):
@@ -121,25 +99,33 @@ def part1(map: Map) -> int:
 
         crucibles = new_crucibles
 
+    counts["states expanded"] += expanded
+    counts["states pruned"] += pruned
+
+    assert minimum_heat_loss is not None
     return minimum_heat_loss
 
 
 def part2(map: Map) -> int:
-    end = max(map)
+    end = (map.height - 1, map.width - 1)
 
     crucibles = {
-        Crucible((0, 0), Direction.RIGHT, 9, 0, is_ultra=True),
-        Crucible((0, 0), Direction.DOWN, 9, 0, is_ultra=True),
+        Crucible((0, 0), RIGHT, 9, 0, is_ultra=True),
+        Crucible((0, 0), DOWN, 9, 0, is_ultra=True),
     }
 
     seen : dict[tuple[tuple[int, int], Direction, int], int] = {}
     minimum_heat_loss = None
+    counts = counters()
+    expanded = pruned = 0
 
     while crucibles:
         new_crucibles = set[Crucible]()
+        high_water(counts, "queue high-water", len(crucibles))
 
         for crucible in crucibles:
             if minimum_heat_loss is not None and crucible.heat_loss_total > minimum_heat_loss:
+                pruned += 1
                 continue
 
             if crucible.position not in map:
@@ -147,8 +133,10 @@ def part2(map: Map) -> int:
 
             if (seen_heat_loss := seen.get((crucible.position, crucible.direction, crucible.remaining_movements_in_direction))) is not None:
                 if crucible.heat_loss_total >= seen_heat_loss:
+                    pruned += 1
                     continue
 
+            expanded += 1
             seen[(crucible.position, crucible.direction, crucible.remaining_movements_in_direction)] = crucible.heat_loss_total
 
             if crucible.position == end and crucible.remaining_movements_in_direction <= 6 and (minimum_heat_loss is None or crucible.heat_loss_total < minimum_heat_loss):
@@ -162,12 +150,16 @@ def part2(map: Map) -> int:
 
         crucibles = new_crucibles
 
+    counts["states expanded"] += expanded
+    counts["states pruned"] += pruned
+
+    assert minimum_heat_loss is not None
     return minimum_heat_loss
 
 
 if __name__ == "__main__":
     with open("input.txt") as file:
-        map = parse_map(file)
+        map = parse(file)
 
     print(part1(map))
     print(part2(map))
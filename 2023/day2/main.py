@@ -1,7 +1,14 @@
+from io import TextIOWrapper
 from typing import Literal
 
+BAG: dict[Literal["red", "green", "blue"], int] = {"red": 12, "green": 13, "blue": 14}
 
-def part1(lines: list[str], bag: dict[Literal["red", "green", "blue"], int]) -> int:
+
+def parse(file: TextIOWrapper) -> list[str]:
+    return file.readlines()
+
+
+def part1(lines: list[str], bag: dict[Literal["red", "green", "blue"], int] = BAG) -> int:
     result = 0
 
     for line in lines:
@@ -51,6 +58,6 @@ def part2(lines: list[str]) -> int:
 
 if __name__ == "__main__":
     with open("input.txt") as file:
-        lines =  file.readlines()
-        print(part1(lines, {"red": 12, "green": 13, "blue": 14}))
+        lines = parse(file)
+        print(part1(lines, BAG))
         print(part2(lines))
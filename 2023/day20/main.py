@@ -1,26 +1,23 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from io import TextIOWrapper
 from dataclasses import dataclass, field
-from queue import Queue
 from typing import Literal
 
-from pprint import pprint
-
 Pulse = Literal[0] | Literal[1]
 
-@dataclass
+@dataclass(slots=True)
 class Module:
     targets: list[str]
 
-@dataclass
+@dataclass(slots=True)
 class Broadcaster(Module):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class FlipFlop(Module):
     state: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class Conjunction(Module):
     inputs: defaultdict[str, Pulse] = field(default_factory=lambda: defaultdict(int))
 
@@ -55,11 +52,11 @@ def parse_configuration(file: TextIOWrapper) -> dict[str, Module]:
     return config
 
 def run_configuration(config: dict[str, Module]) -> tuple[int, int, defaultdict[str, tuple[int, int]]]:
-    queue = Queue[tuple[str, Pulse, str]]()
-    queue.put(("button", 0, "broadcaster"))
+    queue = deque[tuple[str, Pulse, str]]()
+    queue.append(("button", 0, "broadcaster"))
 
     def step() -> None:
-        source, pulse, module = queue.get()
+        source, pulse, module = queue.popleft()
 
         match config.get(module), pulse:
             case Broadcaster(targets), pulse:
@@ -81,12 +78,12 @@ def run_configuration(config: dict[str, Module]) -> tuple[int, int, defaultdict[
                 raise NotImplementedError(m, p)
 
         for target in targets:
-            queue.put((module, pulse, target))
+            queue.append((module, pulse, target))
 
     pulsed_modules = defaultdict[str, tuple[int, int]](lambda: (0, 0))
     low_pulses, high_pulses = 0, 0
-    while not queue.empty():
-        peek_source, peek_pulse, peek_module = queue.queue[0]
+    while queue:
+        peek_source, peek_pulse, peek_module = queue[0]
         pulsed_module_ls, pulsed_module_hs = pulsed_modules[peek_module]
 
         if peek_pulse == 0:
@@ -99,10 +96,10 @@ def run_configuration(config: dict[str, Module]) -> tuple[int, int, defaultdict[
         else:
             raise RuntimeError(f"Unknown pulse: {peek_pulse}")
 
-        #print(f"============ Step {(low_pulses + high_pulses)}: ({queue.queue[0]}) ============")
+        #print(f"============ Step {(low_pulses + high_pulses)}: ({queue[0]}) ============")
         step()
 
-        #pprint((config, list(queue.queue)))
+        #print((config, list(queue)))
 
     return low_pulses, high_pulses, pulsed_modules
 
@@ -0,0 +1,38 @@
+import random
+import sys
+from typing import Iterator
+
+Coord = tuple[int, int, int]
+
+FOOTPRINT = 10  # Bricks lie within x and y in [0, 10) like the real inputs
+MAX_LENGTH = 5
+
+# Each brick's chain reaction can reach every brick above it
+COMPLEXITY = "n^2"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """A snapshot of `scale` non-overlapping bricks falling into a 10x10 column"""
+    occupied = set[Coord]()
+    # Roughly a third of the column is filled so bricks have room to fall
+    max_z = max(scale * 3 * 3 // (FOOTPRINT * FOOTPRINT), MAX_LENGTH) + 1
+
+    while scale:
+        start = (rng.randrange(FOOTPRINT), rng.randrange(FOOTPRINT), rng.randint(1, max_z))
+        axis = rng.randrange(3)
+        end = list(start)
+        end[axis] = min(start[axis] + rng.randrange(MAX_LENGTH), FOOTPRINT - 1 if axis < 2 else max_z)
+        cubes = {
+            tuple(start[i] + step if i == axis else start[i] for i in range(3))
+            for step in range(end[axis] - start[axis] + 1)
+        }
+
+        if occupied.isdisjoint(cubes):
+            occupied.update(cubes)  # type: ignore[arg-type]
+            scale -= 1
+            yield f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
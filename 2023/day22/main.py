@@ -1,14 +1,15 @@
 from collections import defaultdict
 from io import TextIOWrapper
 
+from aoc.phases import phase
+
 
 Coord = tuple[int, int, int]
 Block = list[Coord]
 
 
-def parse_space(file: TextIOWrapper) -> tuple[set[Coord], list[Block]]:
-    space = set[Coord]()
-    blocks = list[Block]()
+def parse(file: TextIOWrapper) -> tuple[tuple[Coord, ...], ...]:
+    blocks = list[tuple[Coord, ...]]()
 
     for line in file:
         (x1, y1, z1), (x2, y2, z2) = [tuple(map(int, item.split(","))) for item in line.strip().split("~")]
@@ -20,8 +21,14 @@ def parse_space(file: TextIOWrapper) -> tuple[set[Coord], list[Block]]:
                 for z in range(z1, z2 + 1):
                     bricks.append((x, y, z))
 
-        space.update(bricks)
-        blocks.append(bricks)
+        blocks.append(tuple(bricks))
+
+    return tuple(blocks)
+
+
+def build_space(snapshot: tuple[tuple[Coord, ...], ...]) -> tuple[set[Coord], list[Block]]:
+    blocks = [list(bricks) for bricks in snapshot]
+    space = {brick for bricks in blocks for brick in bricks}
 
     return space, blocks
 
@@ -97,21 +104,27 @@ def find_disintegratable_blocks(blocks: list[Block]) -> set[int]:
     return disintegratable_blocks
 
 
-def solve(file: TextIOWrapper) -> int:
-    space, blocks = parse_space(file)
-    space, blocks, _ = simulate(space, blocks)
-    disintegratable_blocks = find_disintegratable_blocks(blocks)
-    non_disintegratable_blocks = set(range(len(blocks))) - disintegratable_blocks
+def solve(snapshot: tuple[tuple[Coord, ...], ...]) -> int:
+    with phase("settle"):
+        space, blocks = build_space(snapshot)
+        space, blocks, _ = simulate(space, blocks)
+
+    with phase("find supports"):
+        disintegratable_blocks = find_disintegratable_blocks(blocks)
+        non_disintegratable_blocks = set(range(len(blocks))) - disintegratable_blocks
 
     part_2_result = 0
 
-    for ndb in non_disintegratable_blocks:
-        _, _, fallen = simulate(space.difference(blocks[ndb]), blocks[:ndb] + blocks[ndb+1:])
-        part_2_result += len(fallen)
+    with phase("chain reactions"):
+        for ndb in non_disintegratable_blocks:
+            _, _, fallen = simulate(space.difference(blocks[ndb]), blocks[:ndb] + blocks[ndb+1:])
+            part_2_result += len(fallen)
 
     return len(disintegratable_blocks), part_2_result
 
 
 if __name__ == "__main__":
     with open("input.txt") as file:
-        print(solve(file))
+        snapshot = parse(file)
+
+    print(solve(snapshot))
@@ -4,7 +4,7 @@ import re
 from itertools import combinations
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Hailstone:
     x: int
     y: int
@@ -1,24 +1,28 @@
 from io import TextIOWrapper
-import networkx
 import math
 
+Edge = tuple[str, str]
 
-def parse_graph(file: TextIOWrapper) -> networkx.Graph:
-    graph = networkx.Graph()
+
+def parse(file: TextIOWrapper) -> tuple[Edge, ...]:
+    edges = list[Edge]()
 
     for line in file:
         node, *adj = line.strip().split()
         node = node[:-1]
 
         for a in adj:
-            graph.add_edge(node, a)
-            graph.add_edge(a, node)
+            edges.append((node, a))
+
+    return tuple(edges)
 
-    return graph
 
+def part1(edges: tuple[Edge, ...]) -> int:
+    # networkx takes longer to import than most days take to run, so it's only
+    # imported once a graph is actually needed
+    import networkx
 
-def part1(graph: networkx.Graph) -> int:
-    graph = graph.copy()
+    graph = networkx.Graph(edges)
     graph.remove_edges_from(networkx.minimum_edge_cut(graph))
 
     return math.prod(len(subgraph) for subgraph in networkx.connected_components(graph))
@@ -26,6 +30,6 @@ def part1(graph: networkx.Graph) -> int:
 
 if __name__ == "__main__":
     with open("input.txt") as file:
-        graph = parse_graph(file)
+        edges = parse(file)
 
-    print(part1(graph))
+    print(part1(edges))
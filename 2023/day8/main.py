@@ -1,10 +1,21 @@
 from io import TextIOWrapper
-import signal
-import sys
 from typing import Literal
 
+from aoc.phases import phase
 
-def part1(directions: list[Literal[0, 1]], network: dict[str, tuple[str, str]]) -> int:
+Documents = tuple[list[Literal[0, 1]], dict[str, tuple[str, str]]]
+
+
+def parse(file: TextIOWrapper) -> Documents:
+    directions = [0 if c == "L" else 1 for c in file.readline().strip()]
+    file.readline()
+    network = {line[:3]: (line[7:10], line[12:15]) for line in file}
+
+    return directions, network
+
+
+def part1(documents: Documents) -> int:
+    directions, network = documents
     pos = "AAA"
     steps = 0
     
@@ -16,7 +27,8 @@ def part1(directions: list[Literal[0, 1]], network: dict[str, tuple[str, str]])
             if pos == "ZZZ":
                 return steps
 
-def part2(directions: list[Literal[0, 1]], network: dict[str, tuple[str, str]]) -> int:
+def part2(documents: Documents) -> int:
+    directions, network = documents
     starts = [node for node in network.keys() if node.endswith("A")]
     node_to_terminal = dict[tuple[str, int], tuple[str, int]]() # (node, dir_index) -> (terminal, steps_to_next_terminal)
     
@@ -41,34 +53,29 @@ def part2(directions: list[Literal[0, 1]], network: dict[str, tuple[str, str]])
 
     current = {node: 0 for node in starts}
 
-    def signal_handler(sig, frame):
-        print(current)
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, signal_handler)
-
-    while True:
-        if all(node[2] == "Z" for node in current) and len(set(current.values())) == 1:
-            break
+    # Interrupting the runner reports how long went to walking new paths versus replaying known ones
+    with phase("search"):
+        while True:
+            if all(node[2] == "Z" for node in current) and len(set(current.values())) == 1:
+                break
 
-        min_node = min(current, key=current.get)
-        min_steps = current.pop(min_node)
-        min_dir_index = min_steps % len(directions)
+            min_node = min(current, key=current.get)
+            min_steps = current.pop(min_node)
+            min_dir_index = min_steps % len(directions)
 
-        if (min_node, min_dir_index) not in node_to_terminal:
-            node_to_terminal[(min_node, min_dir_index)] = to_terminal(min_node, min_dir_index)
+            if (min_node, min_dir_index) not in node_to_terminal:
+                with phase("build index"):
+                    node_to_terminal[(min_node, min_dir_index)] = to_terminal(min_node, min_dir_index)
 
-        terminal, num_steps = node_to_terminal[(min_node, min_dir_index)]
-        current[terminal] = min_steps + num_steps
+            terminal, num_steps = node_to_terminal[(min_node, min_dir_index)]
+            current[terminal] = min_steps + num_steps
 
     return current.popitem()[1]
 
 
 if __name__ == "__main__":
     with open("input.txt") as file:
-        directions = [0 if c == "L" else 1 for c in file.readline().strip()]
-        file.readline()
-        network = {line[:3]: (line[7:10], line[12:15]) for line in file}
+        documents = parse(file)
     
-    #print(part1(directions, network))
-    print(part2(directions, network))
+    #print(part1(documents))
+    print(part2(documents))
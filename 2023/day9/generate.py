@@ -0,0 +1,22 @@
+import random
+import sys
+from typing import Iterator
+
+READINGS = 21
+MAX_DEGREE = 15  # Low enough that the differences always reach all zeros
+
+# Histories are independent and of fixed length
+COMPLEXITY = "n"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """`scale` histories, each a random polynomial sampled at 21 points"""
+    for _ in range(scale):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, MAX_DEGREE))]
+        readings = (sum(c * x**i for i, c in enumerate(coefficients)) for x in range(READINGS))
+        yield " ".join(map(str, readings)) + "\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
@@ -1,8 +1,47 @@
 from collections import defaultdict
 from io import TextIOWrapper
+from types import ModuleType
+
+from aoc.backends import numpy
+
+
+def part1and2_numpy(np: ModuleType, file: TextIOWrapper) -> int:
+    # Histories of the same length extrapolate together, a row each. Each
+    # difference at most doubles the largest number, so those that could
+    # overflow an int64 are kept apart as Python ints
+    groups = defaultdict[tuple[int, bool], list[list[int]]](list)
+
+    for line in file:
+        numbers = [int(number) for number in line.split()]
+        fits = max(map(abs, numbers)) << (len(numbers) + 1) < 2**63
+        groups[len(numbers), fits].append(numbers)
+
+    result_1 = 0
+    result_2 = 0
+
+    for (_, fits), histories in groups.items():
+        current_rows = np.array(histories, dtype=np.int64 if fits else object)
+        next_values = current_rows[:, -1].copy()
+        prev_values = current_rows[:, 0].copy()
+        part2_sign = -1
+
+        while current_rows.shape[1] > 1 and current_rows.any():
+            current_rows = np.diff(current_rows, axis=1)
+            prev_values += current_rows[:, 0] * part2_sign
+            next_values += current_rows[:, -1]
+            part2_sign = -part2_sign
+
+        # Summed as Python ints, since the rows' values only fit one at a time
+        result_1 += sum(next_values.tolist())
+        result_2 += sum(prev_values.tolist())
+
+    return result_1, result_2
 
 
 def part1and2(file: TextIOWrapper) -> int:
+    if (np := numpy()) is not None:
+        return part1and2_numpy(np, file)
+
     result_1 = 0
     result_2 = 0
 
@@ -0,0 +1,17 @@
+import random
+import sys
+from typing import Iterator
+
+# Sorting both lists dominates
+COMPLEXITY = "n log n"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """`scale` pairs of five digit location IDs"""
+    for _ in range(scale):
+        yield f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
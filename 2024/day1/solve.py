@@ -1,9 +1,14 @@
-from collections import defaultdict
+from collections import Counter
 from io import TextIOWrapper
 import sys
+from types import ModuleType
 
+from aoc.backends import numpy
 
-def part1(input: TextIOWrapper) -> int:
+Lists = tuple[tuple[int, ...], tuple[int, ...]]
+
+
+def parse(input: TextIOWrapper) -> Lists:
     left, right = list[int](), list[int]()
 
     for line in input:
@@ -12,30 +17,53 @@ def part1(input: TextIOWrapper) -> int:
         left.append(int(l.strip()))
         right.append(int(r.strip()))
 
+    return tuple(left), tuple(right)
+
+
+def part1_numpy(np: ModuleType, lists: Lists) -> int:
+    left, right = np.sort(np.array(lists, dtype=np.int64), axis=1)
+    return int(np.abs(left - right).sum())
+
+
+def part1(lists: Lists) -> int:
+    if (np := numpy()) is not None:
+        return part1_numpy(np, lists)
+
+    left, right = lists
+
     left = sorted(left)
     right = sorted(right)
 
     return sum(abs(l - r) for l, r in zip(left, right))
 
 
-def part2(input: TextIOWrapper) -> int:
-    left, right = list[int](), defaultdict[int, int](int)
+def part2_numpy(np: ModuleType, lists: Lists) -> int:
+    left, right = np.array(lists[0], dtype=np.int64), np.array(lists[1], dtype=np.int64)
+    values, counts = np.unique(right, return_counts=True)
 
-    for line in input:
-        l, r = line.split()
+    # Where each left number would go among the distinct right ones, which is
+    # only a match if the number is there
+    indices = np.searchsorted(values, left).clip(max=len(values) - 1)
+    matches = values[indices] == left
 
-        left.append(int(l.strip()))
+    return int((left * counts[indices] * matches).sum())
 
-        right[int(r)] += 1
 
-    return sum(l * right[l] for l in left)
+def part2(lists: Lists) -> int:
+    if (np := numpy()) is not None:
+        return part2_numpy(np, lists)
+
+    left, right = lists
+    right_counts = Counter(right)
+
+    return sum(l * right_counts[l] for l in left)
 
 
 if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        lists = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(lists))
+    print(part2(lists))
@@ -0,0 +1,16 @@
+import random
+import sys
+from typing import Iterator
+
+# Stones are blinked independently
+COMPLEXITY = "n"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """`scale` stones engraved with numbers of up to seven digits"""
+    yield " ".join(str(rng.randrange(10 ** rng.randint(1, 7))) for _ in range(scale)) + "\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
@@ -3,9 +3,11 @@ from io import TextIOWrapper
 import sys
 from typing import Mapping
 
+from aoc.counters import counters
 
-def parse_stones(input: TextIOWrapper) -> list[int]:
-    return [int(stone) for stone in input.readline().strip().split()]
+
+def parse(input: TextIOWrapper) -> tuple[int, ...]:
+    return tuple(int(stone) for stone in input.readline().strip().split())
 
 
 def handle_stone(stone: int) -> list[int]:
@@ -21,15 +23,17 @@ def handle_stone(stone: int) -> list[int]:
         return [stone * 2024]
 
 
-def run(stones: list[int], num_iterations: int) -> Mapping[int, int]:
+def run(stones: tuple[int, ...], num_iterations: int) -> Mapping[int, int]:
     cache = dict[int, list[int]]()
     prev_iteration = defaultdict[int, int](int)
+    lookups = 0
 
     for stone in stones:
         prev_iteration[stone] += 1
 
     for _ in range(num_iterations):
         cur_iteration = defaultdict[int, int](int)
+        lookups += len(prev_iteration)
 
         for stone, count in prev_iteration.items():
             if stone not in cache:
@@ -40,16 +44,19 @@ def run(stones: list[int], num_iterations: int) -> Mapping[int, int]:
 
         prev_iteration = cur_iteration
 
+    # Every distinct stone of an iteration is looked up once and each miss adds an entry
+    counts = counters()
+    counts["cache hits"] += lookups - len(cache)
+    counts["cache misses"] += len(cache)
+
     return prev_iteration
 
 
-def part1(input: TextIOWrapper) -> int:
-    stones = parse_stones(input)
+def part1(stones: tuple[int, ...]) -> int:
     return sum(run(stones, 25).values())
 
 
-def part2(input: TextIOWrapper) -> int:
-    stones = parse_stones(input)
+def part2(stones: tuple[int, ...]) -> int:
     return sum(run(stones, 75).values())
 
 
@@ -57,7 +64,7 @@ if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        stones = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(stones))
+    print(part2(stones))
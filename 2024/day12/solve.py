@@ -2,8 +2,8 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from io import TextIOWrapper
 import sys
-import string
 
+from aoc.grid import Grid
 
 Vec2 = tuple[int, int]
 
@@ -86,22 +86,13 @@ class Region:
         return num_sides
 
 
-def parse_map(input: TextIOWrapper) -> dict[Vec2, int]:
-    map = dict[Vec2, int]()
+def parse(input: TextIOWrapper) -> Grid:
+    return Grid.parse(input).freeze()
 
-    for row, line in enumerate(input):
-        for col, char in enumerate(line):
-            if char in string.whitespace:
-                continue
 
-            map[(row, col)] = ord(char)
-
-    return map
-
-
-def get_regions(map: dict[Vec2, int]) -> list[Region]:
+def get_regions(map: Grid) -> list[Region]:
     regions = list[Region]()
-    not_seen = set(map.keys())
+    not_seen = set(map.positions())
 
     while not_seen:
         region = Region()
@@ -135,15 +126,13 @@ def get_regions(map: dict[Vec2, int]) -> list[Region]:
     return regions
 
 
-def part1(input: TextIOWrapper) -> int:
-    map = parse_map(input)
+def part1(map: Grid) -> int:
     regions = get_regions(map)
 
     return sum((len(region.tiles) * len(region.perimeter)) for region in regions)
 
 
-def part2(input: TextIOWrapper) -> int:
-    map = parse_map(input)
+def part2(map: Grid) -> int:
     regions = get_regions(map)
 
     return sum((len(region.tiles) * region.calculate_num_sides()) for region in regions)
@@ -153,7 +142,7 @@ if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        map = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(map))
+    print(part2(map))
@@ -7,7 +7,7 @@ Vec2 = tuple[int, int]
 ClawMachine = tuple[Vec2, Vec2, Vec2]
 
 
-def parse_claw_machines(input: TextIOWrapper) -> list[ClawMachine]:
+def parse(input: TextIOWrapper) -> tuple[ClawMachine, ...]:
     def get_numbers(line: str) -> Vec2:
         a, b = "".join(
             char for char in line if (char in string.digits or char == ",")
@@ -26,7 +26,7 @@ def parse_claw_machines(input: TextIOWrapper) -> list[ClawMachine]:
         if not input.readline():
             break
 
-    return claw_machines
+    return tuple(claw_machines)
 
 
 def solve(button_a: Vec2, button_b: Vec2, prize: Vec2, error) -> Optional[int]:
@@ -48,20 +48,20 @@ def solve(button_a: Vec2, button_b: Vec2, prize: Vec2, error) -> Optional[int]:
     return None
 
 
-def part1(input: TextIOWrapper) -> int:
+def part1(claw_machines: tuple[ClawMachine, ...]) -> int:
     return sum(
         tokens
-        for button_a, button_b, prize in parse_claw_machines(input)
+        for button_a, button_b, prize in claw_machines
         if (tokens := solve(button_a, button_b, prize, error=1e-9)) is not None
     )
 
 
-def part2(input: TextIOWrapper) -> int:
+def part2(claw_machines: tuple[ClawMachine, ...]) -> int:
     add = 10000000000000
 
     return sum(
         tokens
-        for button_a, button_b, (Px, Py) in parse_claw_machines(input)
+        for button_a, button_b, (Px, Py) in claw_machines
         if (tokens := solve(button_a, button_b, (Px + add, Py + add), error=1e-3))
         is not None
     )
@@ -71,7 +71,7 @@ if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        claw_machines = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(claw_machines))
+    print(part2(claw_machines))
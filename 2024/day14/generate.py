@@ -0,0 +1,21 @@
+import random
+import sys
+from typing import Iterator
+
+MAP_WIDTH, MAP_HEIGHT = 101, 103
+
+# Robots move independently
+COMPLEXITY = "n"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """`scale` robots scattered over the 101x103 bathroom"""
+    for _ in range(scale):
+        x, y = rng.randrange(MAP_WIDTH), rng.randrange(MAP_HEIGHT)
+        vx, vy = rng.randint(-MAP_WIDTH, MAP_WIDTH), rng.randint(-MAP_HEIGHT, MAP_HEIGHT)
+        yield f"p={x},{y} v={vx},{vy}\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from io import TextIOWrapper
-import math
 import sys
-from typing import Optional
+
+from aoc.grid import Grid
 
 Vec2 = tuple[int, int]
 
@@ -14,40 +14,29 @@ MOVEMENTS_TO_VEC2 = {
 }
 
 
-def parse_map(input: TextIOWrapper) -> tuple[dict[Vec2, str], str, Vec2]:
-    map = dict[Vec2, str]()
-    robot: Vec2 = (0, 0)
-
-    for row, line in enumerate(input):
-        line = line.strip()
+Warehouse = tuple[Grid, str, Vec2]
 
-        if not line:
-            break
 
-        for col, char in enumerate(line):
-            if char == ".":
-                continue
-            elif char == "@":
-                robot = (row, col)
-                continue
-
-            map[(row, col)] = char
+def parse(input: TextIOWrapper) -> Warehouse:
+    map = Grid.parse(input)
+    robot: Vec2 = next(map.find(ord("@")), (0, 0))
+    map[robot] = ord(".")
 
     movements = "".join(line.strip() for line in input)
-    return map, movements, robot
+    return map.freeze(), movements, robot
 
 
-def resize_map(original: dict[Vec2, str]) -> dict[Vec2, str]:
+def resize_map(original: Grid) -> Grid:
     return original
 
 
-def move_robot_part_1(robot: Vec2, map: dict[Vec2, str], direction: Vec2) -> Vec2:
+def move_robot_part_1(robot: Vec2, map: Grid, direction: Vec2) -> Vec2:
     robot_row, robot_col = robot
     dir_y, dir_x = direction
     target = (robot_row + dir_y, robot_col + dir_x)
 
-    match map.get(target):
-        case None:
+    match map.char(target):
+        case ".":
             return target
         case "#":
             return robot
@@ -57,10 +46,10 @@ def move_robot_part_1(robot: Vec2, map: dict[Vec2, str], direction: Vec2) -> Vec
             while True:
                 current = (current[0] + dir_y, current[1] + dir_x)
 
-                match map.get(current):
-                    case None:
-                        map[current] = "O"
-                        del map[target]
+                match map.char(current):
+                    case ".":
+                        map[current] = ord("O")
+                        map[target] = ord(".")
                         return target
                     case "#":
                         return robot
@@ -72,13 +61,13 @@ def move_robot_part_1(robot: Vec2, map: dict[Vec2, str], direction: Vec2) -> Vec
             raise NotImplementedError(char)
         
 
-def move_robot_part_2(robot: Vec2, map: dict[Vec2, str], direction: Vec2) -> Vec2:
+def move_robot_part_2(robot: Vec2, map: Grid, direction: Vec2) -> Vec2:
     robot_row, robot_col = robot
     dir_y, dir_x = direction
     target = (robot_row + dir_y, robot_col + dir_x)
 
-    match map.get(target):
-        case None:
+    match map.char(target):
+        case ".":
             return target
         case "#":
             return robot
@@ -88,10 +77,10 @@ def move_robot_part_2(robot: Vec2, map: dict[Vec2, str], direction: Vec2) -> Vec
             while True:
                 current = (current[0] + dir_y, current[1] + dir_x)
 
-                match map.get(current):
-                    case None:
-                        map[current] = "O"
-                        del map[target]
+                match map.char(current):
+                    case ".":
+                        map[current] = ord("O")
+                        map[target] = ord(".")
                         return target
                     case "#":
                         return robot
@@ -103,30 +92,31 @@ def move_robot_part_2(robot: Vec2, map: dict[Vec2, str], direction: Vec2) -> Vec
             raise NotImplementedError(char)
 
 
-def part1(input: TextIOWrapper) -> int:
-    map, movements, robot = parse_map(input)
+def part1(warehouse: Warehouse) -> int:
+    map, movements, robot = warehouse
+    map = map.copy()
 
     for movement in movements:
         robot = move_robot_part_1(robot, map, MOVEMENTS_TO_VEC2[movement])
 
-    return sum((100 * row + col) for (row, col), char in map.items() if char == "O")
+    return sum((100 * row + col) for row, col in map.find(ord("O")))
 
 
-def part2(input: TextIOWrapper) -> int:
-    map, movements, robot = parse_map(input)
-    map = resize_map(map)
+def part2(warehouse: Warehouse) -> int:
+    map, movements, robot = warehouse
+    map = resize_map(map.copy())
 
     for movement in movements:
         robot = move_robot_part_2(robot, map, MOVEMENTS_TO_VEC2[movement])
 
-    return sum((100 * row + col) for (row, col), char in map.items() if char == "[")
+    return sum((100 * row + col) for row, col in map.find(ord("[")))
 
 
 if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        warehouse = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(warehouse))
+    print(part2(warehouse))
@@ -1,22 +1,32 @@
 from io import TextIOWrapper
 import sys
 
+from aoc.counters import counters
+from aoc.parallel import fan_out
 
-def parse_input(input: TextIOWrapper) -> tuple[set[str], list[str]]:
-    patterns = set(input.readline().strip().split(", "))
+
+Onsen = tuple[frozenset[str], tuple[str, ...]]
+
+
+def parse(input: TextIOWrapper) -> Onsen:
+    patterns = frozenset(input.readline().strip().split(", "))
     input.readline()
-    designs = [line.strip() for line in input.readlines()]
+    designs = tuple(line.strip() for line in input.readlines())
 
     return patterns, designs
 
 
-def num_ways_to_make_design(
-    patterns: set[str], design: str, cache: dict[str, int]
-) -> int:
+# The number of ways to make a design, with the cache hits and misses of working it out
+Ways = tuple[int, int, int]
+
+
+def num_ways_to_make_design(patterns: frozenset[str], design: str, cache: dict[str, int]) -> Ways:
+    # Hits and misses are counted in locals and returned rather than added to
+    # a Counter on every call, which made the recursion ~15% slower
     if design in cache:
-        return cache[design]
+        return cache[design], 1, 0
 
-    count = 0
+    count, hits, misses = 0, 0, 1
 
     for size in reversed(range(len(design))):
         if design[: size + 1] not in patterns:
@@ -27,37 +37,51 @@ def num_ways_to_make_design(
         if not remaining:
             count += 1
         else:
-            count += num_ways_to_make_design(patterns, remaining, cache)
+            ways, child_hits, child_misses = num_ways_to_make_design(patterns, remaining, cache)
+            count += ways
+            hits += child_hits
+            misses += child_misses
 
     cache[design] = count
-    return count
+    return count, hits, misses
 
 
-def can_make_design(patterns: set[str], design: str, cache: dict[str, int]) -> bool:
-    # This is less efficient than stopping once a design is determined
-    # can be made but hey
-    return num_ways_to_make_design(patterns, design, cache) != 0
+def design_ways(onsen: tuple[frozenset[str], dict[str, int]], design: str) -> Ways:
+    patterns, cache = onsen
+    return num_ways_to_make_design(patterns, design, cache)
 
 
-def part1(input: TextIOWrapper) -> int:
-    patterns, designs = parse_input(input)
-    cache = dict[str, int]()
+def count_ways(patterns: frozenset[str], designs: tuple[str, ...]) -> list[int]:
+    # Designs share the cache of suffix counts. Its entries never change once
+    # set, so threads can fill it concurrently and each worker process keeps
+    # its own for every design it is sent
+    results = fan_out(design_ways, (patterns, dict[str, int]()), designs)
 
-    return sum(can_make_design(patterns, design, cache) for design in designs)
+    counts = counters()
+    counts["cache hits"] += sum(hits for _, hits, _ in results)
+    counts["cache misses"] += sum(misses for _, _, misses in results)
 
+    return [ways for ways, _, _ in results]
 
-def part2(input: TextIOWrapper) -> int:
-    patterns, designs = parse_input(input)
-    cache = dict[str, int]()
 
-    return sum(num_ways_to_make_design(patterns, design, cache) for design in designs)
+def part1(onsen: Onsen) -> int:
+    patterns, designs = onsen
+
+    # This is less efficient than stopping once a design is determined
+    # can be made but hey
+    return sum(ways != 0 for ways in count_ways(patterns, designs))
+
+
+def part2(onsen: Onsen) -> int:
+    patterns, designs = onsen
+    return sum(count_ways(patterns, designs))
 
 
 if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        onsen = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(onsen))
+    print(part2(onsen))
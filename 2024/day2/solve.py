@@ -29,21 +29,26 @@ def is_report_safe(report: Iterable[int]) -> bool:
     return safe
 
 
-def part1(input: TextIOWrapper) -> int:
-    return sum(is_report_safe(int(level) for level in line.split()) for line in input)
+Report = tuple[int, ...]
 
 
-def part2(input: TextIOWrapper) -> int:
-    safe_reports = 0
+def parse(input: TextIOWrapper) -> tuple[Report, ...]:
+    return tuple(tuple(int(level) for level in line.split()) for line in input)
+
+
+def part1(reports: tuple[Report, ...]) -> int:
+    return sum(is_report_safe(iter(report)) for report in reports)
 
-    for line in input:
-        original_report = [int(level) for level in line.split()]
 
+def part2(reports: tuple[Report, ...]) -> int:
+    safe_reports = 0
+
+    for original_report in reports:
         if is_report_safe(iter(original_report)):
             safe_reports += 1
             continue
         
-        for i in range(len(line)):
+        for i in range(len(original_report)):
             report = iter(original_report[0:i] + original_report[i+1:])
 
             if is_report_safe(report):
@@ -57,7 +62,7 @@ if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        reports = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(reports))
+    print(part2(reports))
@@ -2,10 +2,18 @@ from io import TextIOWrapper
 import re
 import sys
 
-PATTERN = re.compile("mul\\(([0-9]+),([0-9]+)\\)")
+from aoc.inputs import Buffer, map_input
 
-def part1(input: TextIOWrapper) -> int:
-    memory = "".join(line for line in input)
+PATTERN = re.compile(rb"mul\(([0-9]+),([0-9]+)\)")
+DO = b"do()"
+DONT = b"don't()"
+
+def parse(input: TextIOWrapper) -> Buffer:
+    # The regex scans the mapped bytes directly, so the input is never decoded
+    return map_input(input)
+
+
+def part1(memory: Buffer) -> int:
     result = 0
 
     for i in range(len(memory)):
@@ -19,8 +27,7 @@ def part1(input: TextIOWrapper) -> int:
 
     return result
 
-def part2(input: TextIOWrapper) -> int:
-    memory = "".join(line for line in input)
+def part2(memory: Buffer) -> int:
     result = 0
     enabled = True
 
@@ -31,12 +38,12 @@ def part2(input: TextIOWrapper) -> int:
                 result += int(left) * int(right)
 
             i = match.end()
-        elif memory.startswith("do()", i):
+        elif memory[i : i + len(DO)] == DO:
             enabled = True
-            i += 4
-        elif memory.startswith("don't()", i):
+            i += len(DO)
+        elif memory[i : i + len(DONT)] == DONT:
             enabled = False
-            i += 7
+            i += len(DONT)
 
     return result
 
@@ -45,7 +52,7 @@ if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        memory = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(memory))
+    print(part2(memory))
@@ -2,7 +2,7 @@ from io import TextIOWrapper
 import sys
 
 
-def get_char(map: list[str], row: int, col: int) -> str | None:
+def get_char(map: tuple[str, ...], row: int, col: int) -> str | None:
     if row < 0 or row >= len(map):
         return None
 
@@ -14,7 +14,7 @@ def get_char(map: list[str], row: int, col: int) -> str | None:
     return line[col]
 
 
-def get_num_xmas(origin: tuple[int, int], map: list[str]) -> int:
+def get_num_xmas(origin: tuple[int, int], map: tuple[str, ...]) -> int:
     origin_row, origin_col = origin
     count = 0
 
@@ -42,7 +42,7 @@ def get_num_xmas(origin: tuple[int, int], map: list[str]) -> int:
     return count
 
 
-def is_x_mas(origin: tuple[int, int], map: list[str]) -> bool:
+def is_x_mas(origin: tuple[int, int], map: tuple[str, ...]) -> bool:
     origin_row, origin_col = origin
 
     possibilities = {
@@ -62,34 +62,29 @@ def is_x_mas(origin: tuple[int, int], map: list[str]) -> bool:
     return chars in possibilities
 
 
-def part1(input: TextIOWrapper) -> int:
-    possible_origins = list[tuple[int, int]]()
-    map = list[str]()
+def parse(input: TextIOWrapper) -> tuple[str, ...]:
+    return tuple(line.strip() for line in input)
 
-    # Build the map
-    for row, line in enumerate(input):
-        map.append(line)
 
-        for col, char in enumerate(line):
-            if char == "X":
-                possible_origins.append((row, col))
+def find_chars(map: tuple[str, ...], target: str) -> list[tuple[int, int]]:
+    return [
+        (row, col)
+        for row, line in enumerate(map)
+        for col, char in enumerate(line)
+        if char == target
+    ]
+
+
+def part1(map: tuple[str, ...]) -> int:
+    possible_origins = find_chars(map, "X")
 
     return sum(
         get_num_xmas(possible_origin, map) for possible_origin in possible_origins
     )
 
 
-def part2(input: TextIOWrapper) -> int:
-    possible_origins = list[tuple[int, int]]()
-    map = list[str]()
-
-    # Build the map
-    for row, line in enumerate(input):
-        map.append(line)
-
-        for col, char in enumerate(line):
-            if char == "A":
-                possible_origins.append((row, col))
+def part2(map: tuple[str, ...]) -> int:
+    possible_origins = find_chars(map, "A")
 
     return sum(
         is_x_mas(possible_origin, map) for possible_origin in possible_origins
@@ -100,7 +95,7 @@ if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        map = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(map))
+    print(part2(map))
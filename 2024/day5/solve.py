@@ -22,7 +22,7 @@ def cmp(a: int, b: int, graph: Mapping[int, set[int]]) -> int:
         return 1  # b > a
 
 
-def build_graph(input: TextIOWrapper) -> Mapping[int, set[int]]:
+def build_graph(input: TextIOWrapper) -> Mapping[int, frozenset[int]]:
     graph = defaultdict[int, set[int]](set[int])
 
     for line in input:
@@ -32,7 +32,7 @@ def build_graph(input: TextIOWrapper) -> Mapping[int, set[int]]:
         left, right = tuple(int(i) for i in line.split("|"))
         graph[left].add(right)
 
-    return graph
+    return {num: frozenset(greaters) for num, greaters in graph.items()}
 
 
 def get_page_graph(
@@ -43,13 +43,23 @@ def get_page_graph(
     return {num: greaters for num, greaters in graph.items() if num in page_set}
 
 
-def get_pages(input: TextIOWrapper) -> tuple[list[int], list[int]]:
+Manual = tuple[Mapping[int, frozenset[int]], tuple[tuple[int, ...], ...]]
+
+
+def parse(input: TextIOWrapper) -> Manual:
     graph = build_graph(input)
-    ordered = list[int]()
-    reordered = list[int]()
+    pages = tuple(tuple(int(i) for i in line.split(",")) for line in input)
 
-    for line in input:
-        page = [int(i) for i in line.split(",")]
+    return graph, pages
+
+
+def get_pages(manual: Manual) -> tuple[list[list[int]], list[list[int]]]:
+    graph, pages = manual
+    ordered = list[list[int]]()
+    reordered = list[list[int]]()
+
+    for page in pages:
+        page = list(page)
         page_graph = get_page_graph(page, graph)
 
         # Compare pairwise
@@ -66,11 +76,20 @@ def get_pages(input: TextIOWrapper) -> tuple[list[int], list[int]]:
     return ordered, reordered
 
 
+def part1and2(manual: Manual) -> tuple[int, int]:
+    ordered_pages, reordered_pages = get_pages(manual)
+
+    return (
+        sum(page[len(page) // 2] for page in ordered_pages),
+        sum(page[len(page) // 2] for page in reordered_pages),
+    )
+
+
 if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        ordered_pages, reordered_pages = get_pages(file)
+        manual = parse(file)
 
-        print(sum(page[len(page) // 2] for page in ordered_pages))
-        print(sum(page[len(page) // 2] for page in reordered_pages))
+    for answer in part1and2(manual):
+        print(answer)
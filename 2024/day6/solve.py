@@ -2,41 +2,34 @@ from io import TextIOWrapper
 import sys
 from typing import Literal
 
-Direction = Literal["U", "D", "L", "R"]
+from aoc.directions import DELTAS, TURN_RIGHT, UP, Direction
+from aoc.grid import Grid
+from aoc.parallel import fan_out
+
 Vec2 = tuple[int, int]
 TerminationReason = Literal["OFF_MAP", "LOOP"]
 
+OBSTACLE, EMPTY = ord("#"), ord(".")
 
-def read_map(input: TextIOWrapper) -> tuple[Vec2, set[Vec2], Vec2]:
-    obstacles = set[Vec2]()
 
-    lines = list(line.strip() for line in input)
-    map_size = len(lines[0]), len(lines)
-    guard_pos: Vec2 | None = None
+def parse(input: TextIOWrapper) -> tuple[Grid, Vec2]:
+    map = Grid.parse(input)
+    guard_pos: Vec2 | None = next(map.find(ord("^")), None)
 
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line):
-            match char:
-                case ".":
-                    continue
-                case "#":
-                    obstacles.add((row, col))
-                case "^":
-                    guard_pos = (row, col)
-                    continue
-                case char:
-                    raise NotImplementedError(char)
+    for char in set(map.cells) - {OBSTACLE, EMPTY, ord("^")}:
+        raise NotImplementedError(chr(char))
 
     assert guard_pos is not None
-    return map_size, obstacles, guard_pos
+    map[guard_pos] = EMPTY
+    return map.freeze(), guard_pos
 
 
 def simulate(
-    map_size: Vec2, obstacles: set[Vec2], guard_pos: Vec2
+    map: Grid, guard_pos: Vec2
 ) -> tuple[set[tuple[Vec2, Direction]], TerminationReason]:
-    map_width, map_height = map_size
+    map_width, map_height, cells = map.width, map.height, map.cells
     guard_row, guard_col = guard_pos
-    guard_dir: Direction = "U"
+    guard_dir: Direction = UP
     tiles_touched = set[tuple[Vec2, Direction]]()
 
     termination_reason: TerminationReason = "OFF_MAP"
@@ -48,65 +41,60 @@ def simulate(
 
         tiles_touched.add(pair)
 
-        match guard_dir:
-            case "U":
-                new_pos = (guard_row - 1, guard_col)
-                new_dir = "R"
-            case "D":
-                new_pos = (guard_row + 1, guard_col)
-                new_dir = "L"
-            case "L":
-                new_pos = (guard_row, guard_col - 1)
-                new_dir = "U"
-            case "R":
-                new_pos = (guard_row, guard_col + 1)
-                new_dir = "D"
-
-        if new_pos in obstacles:
-            guard_dir = new_dir
+        row_offset, col_offset = DELTAS[guard_dir]
+        new_row, new_col = new_pos = (guard_row + row_offset, guard_col + col_offset)
+
+        if (
+            0 <= new_row < map_height
+            and 0 <= new_col < map_width
+            and cells[new_row * map_width + new_col] == OBSTACLE
+        ):
+            guard_dir = TURN_RIGHT[guard_dir]
         else:
             guard_row, guard_col = guard_pos = new_pos
 
     return tiles_touched, termination_reason
 
 
-def part1(input: TextIOWrapper) -> int:
-    (map_width, map_height), obstacles, guard_pos = read_map(input)
-    tiles_touched, _ = simulate((map_width, map_height), obstacles, guard_pos)
+def part1(lab: tuple[Grid, Vec2]) -> int:
+    map, guard_pos = lab
+    tiles_touched, _ = simulate(map, guard_pos)
 
     return len(set(tile_pos for tile_pos, _ in tiles_touched))
 
 
-def part2(input: TextIOWrapper) -> int:
-    (map_width, map_height), obstacles, guard_pos = read_map(input)
+def loops_with_obstacle(lab: tuple[Grid, Vec2], obstacle: Vec2) -> bool:
+    map, guard_pos = lab
+
+    # The map is shared by every obstacle's simulation, so each one places its
+    # obstacle in a copy; copying is cheap next to simulating
+    map = map.copy()
+    map[obstacle] = OBSTACLE
+    _, termination_reason = simulate(map, guard_pos)
+
+    return termination_reason == "LOOP"
+
+
+def part2(lab: tuple[Grid, Vec2]) -> int:
+    map, guard_pos = lab
 
     # Run simulation with no additional obstacles to narrow down how many
     # new obstacles we need to test for
-    tiles_touched, _ = simulate((map_width, map_height), obstacles, guard_pos)
+    tiles_touched, _ = simulate(map, guard_pos)
     additional_obstacles = {tile_pos for tile_pos, dir in tiles_touched}
 
     # Don't wanna place an obstacle on the starting pos
     additional_obstacles.remove(guard_pos)
 
     # Simulate with each additional obstacle and check for a loop
-    loops = 0
-
-    for additional_obstacle in additional_obstacles:
-        _, termination_reason = simulate(
-            (map_width, map_height), obstacles | {additional_obstacle}, guard_pos
-        )
-
-        if termination_reason == "LOOP":
-            loops += 1
-
-    return loops
+    return sum(fan_out(loops_with_obstacle, lab, additional_obstacles))
 
 
 if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        lab = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(lab))
+    print(part2(lab))
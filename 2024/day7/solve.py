@@ -2,14 +2,23 @@ from io import TextIOWrapper
 import sys
 from typing import Callable
 
+from aoc.parallel import fan_out
 
-def parse_line(line: str) -> tuple[int, list[int]]:
+
+Equation = tuple[int, tuple[int, ...]]
+
+
+def parse_line(line: str) -> Equation:
     left, right = line.split(": ")
-    return int(left), [int(num) for num in right.split()]
+    return int(left), tuple(int(num) for num in right.split())
+
+
+def parse(input: TextIOWrapper) -> tuple[Equation, ...]:
+    return tuple(parse_line(line) for line in input)
 
 
 def solve_all(
-    equation: list[int],
+    equation: tuple[int, ...],
     upper_limit: int,
     operators: list[Callable[[int, int], int]],
 ) -> list[int]:
@@ -30,54 +39,46 @@ def solve_all(
     return solutions
 
 
-def part1(input: TextIOWrapper) -> int:
-    result = 0
+def add(a: int, b: int) -> int:
+    return a + b
 
-    for line in input:
-        expected, equation = parse_line(line)
 
-        solutions = solve_all(
-            equation,
-            expected,
-            operators=[
-                lambda a, b: a + b,
-                lambda a, b: a * b,
-            ],
-        )
+def multiply(a: int, b: int) -> int:
+    return a * b
 
-        if expected in solutions:
-            result += expected
 
-    return result
+def concatenate(a: int, b: int) -> int:
+    return int(str(a) + str(b))
 
 
-def part2(input: TextIOWrapper) -> int:
-    result = 0
+def calibration_result(
+    operators: list[Callable[[int, int], int]], equation: Equation
+) -> int:
+    expected, nums = equation
+    solutions = solve_all(nums, expected, operators)
 
-    for line in input:
-        expected, equation = parse_line(line)
+    return expected if expected in solutions else 0
 
-        solutions = solve_all(
-            equation,
-            expected,
-            operators=[
-                lambda a, b: a + b,
-                lambda a, b: a * b,
-                lambda a, b: int(str(a) + str(b)),
-            ],
-        )
 
-        if expected in solutions:
-            result += expected
+# Operators are module level functions rather than lambdas so they can be
+# sent to the worker processes of a fan-out
+PART1_OPERATORS: list[Callable[[int, int], int]] = [add, multiply]
+PART2_OPERATORS: list[Callable[[int, int], int]] = [add, multiply, concatenate]
 
-    return result
+
+def part1(equations: tuple[Equation, ...]) -> int:
+    return sum(fan_out(calibration_result, PART1_OPERATORS, equations))
+
+
+def part2(equations: tuple[Equation, ...]) -> int:
+    return sum(fan_out(calibration_result, PART2_OPERATORS, equations))
 
 
 if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        equations = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(equations))
+    print(part2(equations))
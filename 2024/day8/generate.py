@@ -0,0 +1,29 @@
+import math
+import random
+import string
+import sys
+from typing import Iterator
+
+FREQUENCIES = string.ascii_letters[:10]
+DENSITY = 0.04
+
+# Every pair of antennas of a frequency makes antinodes, so at best time grows with the pairs
+COMPLEXITY = "n^2"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """`scale` antennas of ten frequencies on a square map about 4% covered"""
+    size = math.isqrt(math.ceil(scale / DENSITY)) + 1
+    antennas = rng.sample(range(size * size), scale)
+    cells = ["."] * (size * size)
+
+    for cell in antennas:
+        cells[cell] = rng.choice(FREQUENCIES)
+
+    for row in range(size):
+        yield "".join(cells[row * size:(row + 1) * size]) + "\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
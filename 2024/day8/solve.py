@@ -7,6 +7,14 @@ from typing import Mapping
 Vec2 = tuple[int, int]
 
 
+Antennas = tuple[Mapping[str, frozenset[Vec2]], int]
+
+
+def parse(input: TextIOWrapper) -> Antennas:
+    map, map_size = parse_map(input)
+    return {freq: frozenset(antennas) for freq, antennas in map.items()}, map_size
+
+
 def parse_map(input: TextIOWrapper) -> tuple[Mapping[str, set[Vec2]], int]:
     map = defaultdict[str, set[Vec2]](set[Vec2])
     map_size = 0
@@ -25,7 +33,7 @@ def parse_map(input: TextIOWrapper) -> tuple[Mapping[str, set[Vec2]], int]:
 
 
 def find_antinodes(
-    map: Mapping[str, set[Vec2]], map_size: int, max_reps: int = 1
+    map: Mapping[str, frozenset[Vec2]], map_size: int, max_reps: int = 1
 ) -> set[Vec2]:
     pairs = set[tuple[Vec2, Vec2]]()
     antinodes = set[tuple[Vec2]]()
@@ -65,13 +73,13 @@ def find_antinodes(
     return antinodes
 
 
-def part1(input: TextIOWrapper) -> int:
-    map, map_size = parse_map(input)
+def part1(antennas: Antennas) -> int:
+    map, map_size = antennas
     return len(find_antinodes(map, map_size))
 
 
-def part2(input: TextIOWrapper) -> int:
-    map, map_size = parse_map(input)
+def part2(antennas: Antennas) -> int:
+    map, map_size = antennas
     antinodes = find_antinodes(map, map_size, max_reps=map_size * map_size)
     return len(antinodes.union(*map.values()))
 
@@ -80,7 +88,7 @@ if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        antennas = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(antennas))
+    print(part2(antennas))
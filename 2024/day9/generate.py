@@ -0,0 +1,22 @@
+import random
+import sys
+from typing import Iterator
+
+# Compacting can find free spans through a heap per span size
+COMPLEXITY = "n log n"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """A disk map of `scale` digits (rounded up to odd so it ends with a file)"""
+    digits = scale | 1
+
+    for i in range(digits):
+        # Files are never empty, free space may be
+        yield str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9))
+
+    yield "\n"
+
+
+if __name__ == "__main__":
+    assert (scale := next(iter(sys.argv[1:]), "")), "Missing scale argument"
+    sys.stdout.writelines(generate(int(scale), random.Random(int(next(iter(sys.argv[2:]), 0)))))
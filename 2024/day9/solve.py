@@ -1,11 +1,14 @@
 from dataclasses import dataclass
 from io import TextIOWrapper
 import sys
-import time
 from typing import Optional
 
+from aoc.inputs import lines, map_input
 
-@dataclass
+ZERO = ord("0")
+
+
+@dataclass(slots=True)
 class DiskBlock:
     id: int
     allocated_space: int
@@ -25,16 +28,21 @@ class DiskBlock:
         )
 
 
-def parse_disk_map(input: TextIOWrapper) -> tuple[DiskBlock, DiskBlock]:
-    map_iter = iter(input.readline().strip())
+def parse(input: TextIOWrapper) -> memoryview:
+    # A view of the first line of the mapped input; the digits are read as bytes
+    return next(lines(map_input(input)), memoryview(b""))
+
+
+def parse_disk_map(disk_map: memoryview) -> tuple[DiskBlock, DiskBlock]:
+    map_iter = iter(disk_map)
 
     initial_block = DiskBlock(-1, 0, 0, None, None)  # Empty block
     prev_block = initial_block
     id = 0
 
-    while file_size := next(map_iter, None):
-        file_size = int(file_size)
-        free_space = int(next(map_iter, 0))
+    while (file_size := next(map_iter, None)) is not None:
+        file_size -= ZERO
+        free_space = next(map_iter, ZERO) - ZERO
         cur_block = DiskBlock(id, file_size, free_space, prev_block, None)
 
         prev_block.next_block = cur_block
@@ -49,7 +57,9 @@ def calculate_checksum(initial_block: DiskBlock) -> int:
     disk_position = 0
     result = 0
 
-    while cur_block := cur_block.next_block:
+    while (next_block := cur_block.next_block) is not None:
+        cur_block = next_block
+
         # Optimization: We could use the summation formula
         for _ in range(cur_block.allocated_space):
             result += cur_block.id * disk_position
@@ -59,11 +69,13 @@ def calculate_checksum(initial_block: DiskBlock) -> int:
 
     return result
 
-def part1(input: TextIOWrapper) -> int:
-    initial_block, final_block = parse_disk_map(input)
+def part1(disk_map: memoryview) -> int:
+    initial_block, final_block = parse_disk_map(disk_map)
     cur_block = initial_block
 
-    while cur_block := cur_block.next_block:
+    while (next_block := cur_block.next_block) is not None:
+        cur_block = next_block
+
         if not cur_block.free_space or not cur_block.next_block:
             continue
         elif cur_block.free_space < final_block.allocated_space:
@@ -104,15 +116,15 @@ def part1(input: TextIOWrapper) -> int:
     return calculate_checksum(initial_block)
 
 
-def part2(input: TextIOWrapper) -> int:
-    initial_block, block_of_importance = parse_disk_map(input)
+def part2(disk_map: memoryview) -> int:
+    initial_block, block_of_importance = parse_disk_map(disk_map)
 
     while block_of_importance.id != 0:
         # Find the next block of importance as the right bound of search
-        next_block_of_importance = block_of_importance.prev_block
+        assert (next_block_of_importance := block_of_importance.prev_block) is not None
 
         while next_block_of_importance.id != (block_of_importance.id - 1):
-            next_block_of_importance = next_block_of_importance.prev_block
+            assert (next_block_of_importance := next_block_of_importance.prev_block) is not None
 
         # Starting from the beginning of the disk, check for free space that can fit
         # the block of importance. If there is one, move it there. Otherwise, leave it
@@ -124,6 +136,7 @@ def part2(input: TextIOWrapper) -> int:
 
         while cur_block.id != block_of_importance.id:
             if cur_block.free_space < block_of_importance.allocated_space:
+                assert cur_block.next_block is not None
                 cur_block = cur_block.next_block
                 continue
 
@@ -154,7 +167,7 @@ if __name__ == "__main__":
     assert (file_path := next(iter(sys.argv[1:]), "")), "Missing file path argument"
 
     with open(file_path) as file:
-        print(part1(file))
+        disk_map = parse(file)
 
-    with open(file_path) as file:
-        print(part2(file))
+    print(part1(disk_map))
+    print(part2(disk_map))
@@ -0,0 +1,4 @@
+"""Tooling for running every year's Python solutions from a single process.
+
+Usage: python -m aoc run [--year YEAR] [--day DAY] [--part PART]
+"""
@@ -0,0 +1,444 @@
+import argparse
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from aoc.answers import save_answers
+from aoc.bench import (
+    HISTORY_PATH,
+    DayBenchmark,
+    append_history,
+    benchmark_day,
+    different_answers,
+    find_regressions,
+    format_benchmark,
+    format_regression,
+    format_speedup,
+    load_history,
+    to_record,
+)
+from aoc.backends import BACKENDS
+from aoc.batch import expand_inputs, run_batch
+from aoc.cache import CACHE_DIR, DEFAULT_MAX_BYTES, ResultCache
+from aoc.compiled import COMPILED_DAYS, BuildError, build
+from aoc.daemon import SOCKET_PATH, query, serve
+from aoc.days import discover, load
+from aoc.imports import format_imports, measure_imports
+from aoc.inputs import COMPRESSIONS
+from aoc.memory import format_memory, format_record_size, format_size, parse_size, record_sizes
+from aoc.models import DEFAULT_MAX_MODEL_BYTES, MODEL_CACHE_DIR, ModelCache
+from aoc.pool import run_days_parallel
+from aoc.profiling import PROFILE_DIR, format_profile
+from aoc.runner import DayResult, as_json, format_result, run_days
+from aoc.sampling import SAMPLE_DIR, format_samples
+from aoc.scaling import format_scaling, scaling_day
+from aoc.stress import STRESS_DIR, generator, stress_input
+from aoc.timings import TIMINGS_PATH, load_timings, record_timings
+
+
+def add_selection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-y", "--year", type=int, action="append", help="only run these years")
+    parser.add_argument("-d", "--day", type=int, action="append", help="only run these days")
+    parser.add_argument("-p", "--part", action="append", help="only run these entry points (e.g. part1)")
+
+
+def add_model_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--model-cache", action="store_true", help="load parsed models from disk instead of parsing")
+    parser.add_argument("--model-cache-dir", type=Path, default=MODEL_CACHE_DIR, help=argparse.SUPPRESS)
+    parser.add_argument("--model-cache-size", type=parse_size, default=DEFAULT_MAX_MODEL_BYTES, help="evict the least recently used models beyond this size")
+
+
+def model_cache_from(args: argparse.Namespace) -> Optional[ModelCache]:
+    return ModelCache(args.model_cache_dir, args.model_cache_size) if args.model_cache else None
+
+
+def run(args: argparse.Namespace) -> int:
+    days = discover(args.year, args.day)
+    start = time.perf_counter()
+    results = list[DayResult]()
+    profile_dir = args.profile_dir if args.profile else None
+    sample_dir = args.sample_dir if args.sample else None
+    fan_out_workers = (args.fan_out_jobs or 0) if args.fan_out else None
+    trace_memory = args.memory or args.memory_budget is not None
+    cache = ResultCache(args.cache_dir, args.cache_size) if args.cache else None
+    model_cache = model_cache_from(args)
+    cached = list[DayResult]()
+
+    # Cached answers would leave nothing to profile or trace, so only look them up on plain runs
+    if cache is not None and profile_dir is None and sample_dir is None and not trace_memory:
+        cached = [hit for day in days if (hit := cache.get(day, args.part)) is not None]
+
+    pending = [day for day in days if day not in {result.day for result in cached}]
+
+    if args.parallel:
+        timings = load_timings(args.timings)
+        finished = run_days_parallel(pending, timings, args.part, args.jobs, profile_dir, trace_memory, model_cache, args.compiled, sample_dir, fan_out_workers, args.backend)
+    else:
+        finished = run_days(pending, args.part, profile_dir, trace_memory, model_cache, args.compiled, sample_dir, fan_out_workers, args.backend)
+
+    for result in itertools.chain(cached, finished):
+        results.append(result)
+
+        if cache is not None:
+            cache.put(result, complete=not args.part)
+
+        for line in format_result(result):
+            print(line, flush=True)
+
+        for part, path in result.profiles.items():
+            for line in format_profile(result.day, part, path, args.profile_top):
+                print(line, flush=True)
+
+        for part, path in result.samples.items():
+            for line in format_samples(result.day, part, path, args.profile_top):
+                print(line, flush=True)
+
+        for part, usage in result.memory.items():
+            for line in format_memory(result.day, part, usage, args.memory_budget):
+                print(line, flush=True)
+
+    print(f"{len(days)} days in {time.perf_counter() - start:.4f}s")
+    record_timings(results, args.timings)
+
+    over_budget = [
+        result
+        for result in results
+        if args.memory_budget is not None and (result.peak_memory or 0) > args.memory_budget
+    ]
+
+    if over_budget:
+        print(f"OVER MEMORY BUDGET {', '.join(f'{result.day.name} ({format_size(result.peak_memory or 0)})' for result in over_budget)}")
+
+    if args.record_answers:
+        for result in results:
+            save_answers(result.day, {
+                part.part: part.answer
+                for part in result.parts
+                if part.error is None and part.answer is not None
+            })
+
+    return 0 if all(result.ok for result in results) and not over_budget else 1
+
+
+def batch(args: argparse.Namespace) -> int:
+    days = discover(args.year, args.day)
+
+    if not (inputs := expand_inputs(args.inputs)):
+        print(f"No inputs match {' '.join(args.inputs)}", file=sys.stderr)
+        return 1
+
+    ok = True
+
+    for path, result in run_batch(days, inputs, args.part, args.jobs, model_cache_from(args), args.compiled):
+        print(json.dumps({"input": str(path)} | as_json(result), default=str), flush=True)
+        ok = ok and result.ok
+
+    return 0 if ok else 1
+
+
+def bench(args: argparse.Namespace) -> int:
+    benchmarks = list[DayBenchmark]()
+    different = list[str]()
+    days = discover(args.year, args.day)
+    model_cache = model_cache_from(args)
+
+    if args.scale:
+        # A sweep only covers the days that can generate inputs
+        runs = [(day, scale) for day in days if generator(day) is not None for scale in sorted(args.scale)]
+    else:
+        runs = [(day, None) for day in days]
+
+    for day, scale in runs:
+        benchmark = benchmark_day(day, args.part, args.warmup, args.repeats, scale, args.seed, model_cache, args.compiled, args.compress, args.backend)
+        benchmarks.append(benchmark)
+
+        for line in format_benchmark(benchmark):
+            print(line, flush=True)
+
+        if args.compare_compiled and not benchmark.compiled:
+            compiled = benchmark_day(day, args.part, args.warmup, args.repeats, scale, args.seed, model_cache, True, args.compress, args.backend)
+
+            # Days without a current build would just be benchmarked twice
+            if compiled.compiled:
+                benchmarks.append(compiled)
+                different += [f"{compiled.name} {part}" for part in different_answers(benchmark, compiled)]
+
+                for line in format_benchmark(compiled) + format_speedup(benchmark, compiled):
+                    print(line, flush=True)
+
+        # Days without a vectorized path would just be benchmarked twice too
+        if args.compare_backends and benchmark.vectorized and benchmark.backend == BACKENDS[0]:
+            for backend in BACKENDS[1:]:
+                other = benchmark_day(day, args.part, args.warmup, args.repeats, scale, args.seed, model_cache, args.compiled, args.compress, backend)
+
+                # Or when the backend isn't installed
+                if other.backend == BACKENDS[0]:
+                    continue
+
+                benchmarks.append(other)
+                different += [f"{other.name} {part}" for part in different_answers(benchmark, other)]
+
+                for line in format_benchmark(other) + format_speedup(benchmark, other, backend):
+                    print(line, flush=True)
+
+    record = to_record(benchmarks)
+    regressions = find_regressions(record, load_history(args.history), args.threshold, args.window)
+
+    for regression in regressions:
+        print(format_regression(regression))
+
+    if args.record:
+        append_history(record, args.history)
+
+    wrong = [benchmark.name for benchmark in benchmarks if benchmark.wrong_answer]
+
+    if wrong:
+        print(f"WRONG ANSWERS {', '.join(wrong)}")
+
+    if different:
+        print(f"DIFFERENT ANSWERS {', '.join(different)}")
+
+    return 1 if regressions or wrong or different else 0
+
+
+def scaling(args: argparse.Namespace) -> int:
+    flagged = list[str]()
+
+    for day in discover(args.year, args.day):
+        if generator(day) is None:
+            continue
+
+        report = scaling_day(day, args.part, args.start, args.factor, args.steps, args.repeats, args.max_seconds, args.seed)
+
+        for line in format_scaling(report):
+            print(line, flush=True)
+
+        if report.error is not None or any(fit.worse_than_expected for fit in report.fits):
+            flagged.append(day.name)
+
+    if flagged:
+        print(f"WORSE THAN EXPECTED {', '.join(flagged)}")
+
+    return 1 if flagged else 0
+
+
+def cache(args: argparse.Namespace) -> int:
+    cache = ResultCache(args.cache_dir)
+
+    if args.clear:
+        cache.clear()
+
+    stats = cache.stats()
+    print(f"{stats.entries} entries, {format_size(stats.size)}")
+    print(f"{stats.hits} hits, {stats.misses} misses ({stats.hit_rate:.1%} hit rate)")
+    return 0
+
+
+def build_days(args: argparse.Namespace) -> int:
+    days = discover(args.year, args.day)
+
+    if not args.year and not args.day:
+        days = [day for day in days if day.name in COMPILED_DAYS]
+
+    failed = list[str]()
+
+    for day in days:
+        try:
+            print(f"{day.name:<12} {build(day)}", flush=True)
+        except BuildError as e:
+            print(f"{day.name:<12} FAILED", flush=True)
+            print(e, flush=True)
+            failed.append(day.name)
+
+    if failed:
+        print(f"FAILED BUILDS {', '.join(failed)}")
+
+    return 1 if failed else 0
+
+
+def daemon(args: argparse.Namespace) -> int:
+    try:
+        serve(args.socket, args.jobs)
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+def ask(args: argparse.Namespace) -> int:
+    requests = [
+        {"year": args.year, "day": args.day, "part": args.part, "input": str(path.resolve()) if path else None}
+        for path in args.input or [None]
+    ]
+    ok = True
+
+    for response in query(requests, args.socket):
+        print(json.dumps(response), flush=True)
+        ok = ok and response["error"] is None and all(
+            part["error"] is None and part["correct"] is not False for part in response["parts"]
+        )
+
+    return 0 if ok else 1
+
+
+def records(args: argparse.Namespace) -> int:
+    for day in discover(args.year, args.day):
+        try:
+            module = load(day)
+        except Exception:
+            continue  # Days that fail to import are reported by `run`
+
+        for record in record_sizes(module):
+            print(format_record_size(day, record), flush=True)
+
+    return 0
+
+
+def imports(args: argparse.Namespace) -> int:
+    over_budget = list[str]()
+
+    for day in discover(args.year, args.day):
+        report = measure_imports(day)
+
+        for line in format_imports(report, args.budget, args.top):
+            print(line, flush=True)
+
+        if report.error is not None or (args.budget is not None and report.seconds > args.budget):
+            over_budget.append(day.name)
+
+    if over_budget:
+        print(f"OVER IMPORT BUDGET {', '.join(over_budget)}")
+
+    return 1 if over_budget else 0
+
+
+def generate(args: argparse.Namespace) -> int:
+    for day in discover(args.year, args.day):
+        if generator(day) is None:
+            continue
+
+        for scale in args.scale:
+            print(stress_input(day, scale, args.seed, args.output, args.compress), flush=True)
+
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="aoc", description="Advent of Code solution runner")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run days in a single process and time each part")
+    add_selection_arguments(run_parser)
+    run_parser.add_argument("--parallel", action="store_true", help="spread days across a process pool, slowest first")
+    run_parser.add_argument("-j", "--jobs", type=int, help="number of worker processes (default: CPU count)")
+    run_parser.add_argument("--timings", type=Path, default=TIMINGS_PATH, help="recorded timings used for scheduling")
+    run_parser.add_argument("--record-answers", action="store_true", help="save this run's answers as the golden answers")
+    run_parser.add_argument("--profile", action="store_true", help="run the parse step and each part under cProfile")
+    run_parser.add_argument("--profile-dir", type=Path, default=PROFILE_DIR, help="where .prof files and text reports are written")
+    run_parser.add_argument("--profile-top", type=int, default=10, help="number of hot functions to print per part")
+    run_parser.add_argument("--sample", action="store_true", help="sample each part's stack from a background thread into flamegraph input")
+    run_parser.add_argument("--sample-dir", type=Path, default=SAMPLE_DIR, help="where collapsed-stack .folded files are written")
+    run_parser.add_argument("--memory", action="store_true", help="trace peak memory and top allocation sites of each part")
+    run_parser.add_argument("--memory-budget", type=parse_size, help="fail days whose peak exceeds this many bytes (e.g. 512M), implies --memory")
+    run_parser.add_argument("--cache", action="store_true", help="reuse answers of unchanged days from the result cache")
+    run_parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR, help=argparse.SUPPRESS)
+    run_parser.add_argument("--cache-size", type=parse_size, default=DEFAULT_MAX_BYTES, help="evict the least recently used answers beyond this size")
+    run_parser.add_argument("--compiled", action="store_true", help="run days from their mypyc builds where one is current")
+    run_parser.add_argument("--backend", choices=BACKENDS, default=BACKENDS[0], help="take days' vectorized paths where they have one and NumPy is installed")
+    run_parser.add_argument("--fan-out", action="store_true", help="spread parts' independent units across threads on free-threaded builds, else processes")
+    run_parser.add_argument("--fan-out-jobs", type=int, help="number of fan-out workers (default: CPU count)")
+    add_model_cache_arguments(run_parser)
+    run_parser.set_defaults(func=run)
+
+    batch_parser = subparsers.add_parser("batch", help="solve many inputs in a worker pool and print JSON lines as they finish")
+    # Inputs belong to one puzzle, so running every day against them would only flood errors
+    batch_parser.add_argument("-y", "--year", type=int, action="append", required=True, help="years of the days to solve with")
+    batch_parser.add_argument("-d", "--day", type=int, action="append", required=True, help="days to solve with")
+    batch_parser.add_argument("-p", "--part", action="append", help="only run these entry points (e.g. part1)")
+    batch_parser.add_argument("inputs", nargs="+", help="input files, directories of inputs or globs (e.g. 'inputs/**/*.txt')")
+    batch_parser.add_argument("-j", "--jobs", type=int, help="number of worker processes (default: CPU count)")
+    batch_parser.add_argument("--compiled", action="store_true", help="solve with the days' mypyc builds where one is current")
+    add_model_cache_arguments(batch_parser)
+    batch_parser.set_defaults(func=batch)
+
+    bench_parser = subparsers.add_parser("bench", help="benchmark parts and check for regressions")
+    add_selection_arguments(bench_parser)
+    bench_parser.add_argument("--warmup", type=int, default=1, help="untimed runs before sampling")
+    bench_parser.add_argument("--repeats", type=int, default=5, help="timed runs per part")
+    bench_parser.add_argument("--history", type=Path, default=HISTORY_PATH, help="JSON file of previous benchmark runs")
+    bench_parser.add_argument("--threshold", type=float, default=1.5, help="median slowdown ratio that counts as a regression")
+    bench_parser.add_argument("--window", type=int, default=5, help="number of previous runs the baseline is taken from")
+    bench_parser.add_argument("--no-record", dest="record", action="store_false", help="don't append this run to the history")
+    bench_parser.add_argument("--scale", type=int, action="append", help="benchmark generated inputs of this size instead")
+    bench_parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    bench_parser.add_argument("--compress", choices=COMPRESSIONS, help="store generated inputs compressed")
+    bench_parser.add_argument("--compiled", action="store_true", help="benchmark days from their mypyc builds where one is current")
+    bench_parser.add_argument("--compare-compiled", action="store_true", help="benchmark built days both ways and report the speed-up")
+    bench_parser.add_argument("--backend", choices=BACKENDS, default=BACKENDS[0], help="take days' vectorized paths where they have one and NumPy is installed")
+    bench_parser.add_argument("--compare-backends", action="store_true", help="benchmark days with a vectorized path on every backend and compare")
+    add_model_cache_arguments(bench_parser)
+    bench_parser.set_defaults(func=bench)
+
+    scaling_parser = subparsers.add_parser("scaling", help="fit how each part's time grows over generated inputs of growing size")
+    add_selection_arguments(scaling_parser)
+    scaling_parser.add_argument("--start", type=int, default=100, help="scale of the smallest input")
+    scaling_parser.add_argument("--factor", type=int, default=2, help="how much each size grows over the last")
+    scaling_parser.add_argument("--steps", type=int, default=6, help="number of sizes to run")
+    scaling_parser.add_argument("--repeats", type=int, default=3, help="timed runs per size")
+    scaling_parser.add_argument("--max-seconds", type=float, default=10.0, help="stop growing once a size takes this long")
+    scaling_parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    scaling_parser.set_defaults(func=scaling)
+
+    cache_parser = subparsers.add_parser("cache", help="show result cache hits and misses")
+    cache_parser.add_argument("--clear", action="store_true", help="remove every entry and reset the counts")
+    cache_parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR, help=argparse.SUPPRESS)
+    cache_parser.set_defaults(func=cache)
+
+    compile_parser = subparsers.add_parser("compile", help="build days into C extensions with mypyc (needs mypy)")
+    compile_parser.add_argument("-y", "--year", type=int, action="append", help="only these years (default: the days known to compile)")
+    compile_parser.add_argument("-d", "--day", type=int, action="append", help="only these days")
+    compile_parser.set_defaults(func=build_days)
+
+    daemon_parser = subparsers.add_parser("daemon", help="serve solves over a Unix socket from pre-imported workers")
+    daemon_parser.add_argument("-j", "--jobs", type=int, help="number of worker processes (default: CPU count)")
+    daemon_parser.add_argument("--socket", type=Path, default=SOCKET_PATH, help="path of the Unix socket")
+    daemon_parser.set_defaults(func=daemon)
+
+    ask_parser = subparsers.add_parser("ask", help="send a solve request to a running daemon")
+    ask_parser.add_argument("-y", "--year", type=int, required=True, help="year of the day to solve")
+    ask_parser.add_argument("-d", "--day", type=int, required=True, help="day to solve")
+    ask_parser.add_argument("-p", "--part", action="append", help="only these entry points (e.g. part1)")
+    ask_parser.add_argument("-i", "--input", type=Path, action="append", help="input files to solve (default: the day's input.txt)")
+    ask_parser.add_argument("--socket", type=Path, default=SOCKET_PATH, help="path of the Unix socket")
+    ask_parser.set_defaults(func=ask)
+
+    records_parser = subparsers.add_parser("records", help="measure the bytes per instance of each day's dataclasses")
+    records_parser.add_argument("-y", "--year", type=int, action="append", help="only these years")
+    records_parser.add_argument("-d", "--day", type=int, action="append", help="only these days")
+    records_parser.set_defaults(func=records)
+
+    imports_parser = subparsers.add_parser("imports", help="measure each day's cold import time with -X importtime")
+    imports_parser.add_argument("-y", "--year", type=int, action="append", help="only these years")
+    imports_parser.add_argument("-d", "--day", type=int, action="append", help="only these days")
+    imports_parser.add_argument("--budget", type=float, help="fail days whose import takes longer than this many seconds")
+    imports_parser.add_argument("--top", type=int, default=5, help="number of direct imports to list per day")
+    imports_parser.set_defaults(func=imports)
+
+    generate_parser = subparsers.add_parser("generate", help="write generated stress inputs for days that have a generator")
+    generate_parser.add_argument("-y", "--year", type=int, action="append", help="only these years")
+    generate_parser.add_argument("-d", "--day", type=int, action="append", help="only these days")
+    generate_parser.add_argument("--scale", type=int, action="append", required=True, help="size of each input (meaning is per day)")
+    generate_parser.add_argument("--seed", type=int, default=0, help="seed for the random generator")
+    generate_parser.add_argument("--output", type=Path, default=STRESS_DIR, help="directory the inputs are written to")
+    generate_parser.add_argument("--compress", choices=COMPRESSIONS, help="write the inputs compressed")
+    generate_parser.set_defaults(func=generate)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from aoc.days import Day
+
+ANSWERS_FILE = "answers.json"
+
+
+def answers_path(day: Day) -> Path:
+    return day.path.parent / ANSWERS_FILE
+
+
+def normalize(answer: Any) -> Any:
+    """Converts an answer to what it would look like after a JSON round trip"""
+    return json.loads(json.dumps(answer, default=str))
+
+
+def load_answers(day: Day) -> dict[str, Any]:
+    try:
+        with open(answers_path(day)) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_answers(day: Day, answers: dict[str, Any]) -> None:
+    recorded = load_answers(day)
+    recorded.update((part, normalize(answer)) for part, answer in answers.items())
+
+    with open(answers_path(day), "w") as file:
+        json.dump(recorded, file, indent=2)
+        file.write("\n")
@@ -0,0 +1,55 @@
+import contextlib
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Iterator, Optional
+
+BACKENDS = ("python", "numpy")
+
+
+@dataclass
+class Backend:
+    name: str
+    offered: bool = False  # whether a part has a vectorized path, taken or not
+    used: bool = False  # whether a part took the backend's path rather than the pure Python one
+
+
+_selected: ContextVar[Optional[Backend]] = ContextVar("backend", default=None)
+
+
+@contextlib.contextmanager
+def using(backend: Backend) -> Iterator[Backend]:
+    """Selects the backend that days with more than one path should take within the block"""
+    if backend.name not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend.name!r}, expected one of {', '.join(BACKENDS)}")
+
+    token = _selected.set(backend)
+
+    try:
+        yield backend
+    finally:
+        _selected.reset(token)
+
+
+def numpy() -> Optional[ModuleType]:
+    """NumPy for a day to vectorize with, or None to take its pure Python path.
+
+    Only given out within `using` the numpy backend and when NumPy is
+    installed, so the same day still runs where it isn't. It takes longer to
+    import than most days take to run, so it is imported on first use.
+    """
+    if (backend := _selected.get()) is None:
+        return None
+
+    backend.offered = True
+
+    if backend.name != "numpy":
+        return None
+
+    try:
+        import numpy  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return None
+
+    backend.used = True
+    return numpy
@@ -0,0 +1,61 @@
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from aoc.days import Day
+from aoc.models import ModelCache
+from aoc.pool import preload
+from aoc.runner import DayResult, run_day
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[Path]:
+    """Expands directories to the files directly in them and everything else as a glob"""
+    paths = list[Path]()
+
+    for pattern in patterns:
+        if (path := Path(pattern)).is_dir():
+            paths += sorted(child for child in path.iterdir() if child.is_file())
+        else:
+            paths += sorted(Path(match) for match in glob.glob(pattern, recursive=True) if Path(match).is_file())
+
+    return list(dict.fromkeys(path.resolve() for path in paths))
+
+
+def run_batch(
+    days: list[Day],
+    inputs: list[Path],
+    parts: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    model_cache: Optional[ModelCache] = None,
+    compiled: bool = False,
+) -> Iterator[tuple[Path, DayResult]]:
+    """Solves every input with every day in a pool of workers, yielding results as they finish.
+
+    Each worker imports the days once when it starts, so module-level setup
+    such as compiled patterns and lookup tables is shared by all the inputs
+    it solves. A day's own input.txt is still checked against its golden
+    answers.
+    """
+    parts = list(parts) if parts else None
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(workers, initializer=preload, initargs=(days, compiled)) as executor:
+        futures = {
+            executor.submit(
+                run_day,
+                day,
+                parts,
+                None,
+                False,
+                None if path == day.input_path.resolve() else path,
+                model_cache,
+                compiled,
+            ): path
+            for day in days
+            for path in inputs
+        }
+
+        for future in as_completed(futures):
+            yield futures[future], future.result()
@@ -0,0 +1,269 @@
+import json
+import math
+import platform
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from aoc.answers import normalize
+from aoc.backends import BACKENDS
+from aoc.days import ROOT, Day
+from aoc.models import ModelCache
+from aoc.runner import describe, run_day
+from aoc.stress import stress_input
+
+HISTORY_PATH = ROOT / ".aoc" / "bench_history.json"
+
+# Parts faster than this are dominated by noise and never flagged as regressions
+NOISE_FLOOR_SECONDS = 0.005
+
+
+@dataclass
+class PartBenchmark:
+    part: str
+    samples: list[float] = field(default_factory=list[float])
+    error: Optional[str] = None
+    wrong_answer: bool = False
+    answer: Any = None  # of the last run, to compare against other builds and backends
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+
+@dataclass
+class DayBenchmark:
+    day: Day
+    parts: dict[str, PartBenchmark] = field(default_factory=dict[str, PartBenchmark])
+    error: Optional[str] = None
+    scale: Optional[int] = None  # None for the day's real input
+    compiled: bool = False
+    backend: str = BACKENDS[0]
+    vectorized: bool = False
+
+    @property
+    def name(self) -> str:
+        name = self.day.name if self.scale is None else f"{self.day.name}@{self.scale}"
+        name = f"{name}+mypyc" if self.compiled else name
+        return f"{name}+{self.backend}" if self.backend != BACKENDS[0] else name
+
+    @property
+    def wrong_answer(self) -> bool:
+        return any(part.wrong_answer for part in self.parts.values())
+
+
+@dataclass
+class Regression:
+    day: str
+    part: str
+    baseline: float
+    median: float
+
+    @property
+    def ratio(self) -> float:
+        return self.median / self.baseline
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """Nearest-rank percentile, which stays meaningful for a handful of samples"""
+    ordered = sorted(samples)
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def benchmark_day(
+    day: Day,
+    parts: Optional[Iterable[str]] = None,
+    warmup: int = 1,
+    repeats: int = 5,
+    scale: Optional[int] = None,
+    seed: int = 0,
+    model_cache: Optional[ModelCache] = None,
+    compiled: bool = False,
+    compression: Optional[str] = None,
+    backend: str = BACKENDS[0],
+) -> DayBenchmark:
+    """Benchmarks a day on its real input, or on a generated one of `scale`.
+
+    Generated inputs are stored with `compression` if given, in which case the
+    parse samples include decompressing them.
+
+    With `model_cache`, parsed models are loaded from disk and only the parts
+    are sampled, since the time to load a model says nothing about parsing.
+    """
+    benchmark = DayBenchmark(day, scale=scale)
+    parts = list(parts) if parts else None
+
+    try:
+        input_path = stress_input(day, scale, seed, compression=compression) if scale is not None else None
+    except Exception as e:
+        benchmark.error = describe(e)
+        return benchmark
+
+    for iteration in range(warmup + repeats):
+        result = run_day(day, parts, input_path=input_path, model_cache=model_cache, compiled=compiled, backend=backend)
+        benchmark.compiled = result.compiled
+        benchmark.backend = result.backend
+        benchmark.vectorized = result.vectorized
+
+        if result.error is not None:
+            benchmark.error = result.error
+            break
+
+        # Warmup runs are still checked for errors and wrong answers
+        warming_up = iteration < warmup
+
+        if result.parse_seconds is not None and not result.model_cached and not warming_up:
+            benchmark.parts.setdefault("parse", PartBenchmark("parse")).samples.append(
+                result.parse_seconds
+            )
+
+        for part_result in result.parts:
+            part = benchmark.parts.setdefault(part_result.part, PartBenchmark(part_result.part))
+            part.answer = part_result.answer
+
+            if part_result.correct is False:
+                # Timings of a solver that gets the answer wrong don't count at all
+                part.error = f"wrong answer {part_result.answer!r}, expected {part_result.expected!r}"
+                part.wrong_answer = True
+                part.samples.clear()
+            elif part_result.error is not None:
+                part.error = part_result.error
+            elif part.error is None and not warming_up:
+                part.samples.append(part_result.seconds)
+
+    return benchmark
+
+
+def load_history(path: Path = HISTORY_PATH) -> list[dict[str, Any]]:
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return []
+
+
+def to_record(benchmarks: Iterable[DayBenchmark]) -> dict[str, Any]:
+    return {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "results": {
+            benchmark.name: {
+                part.part: {
+                    "median": part.median,
+                    "p95": part.p95,
+                    "samples": len(part.samples),
+                }
+                for part in benchmark.parts.values()
+                if part.error is None and part.samples
+            }
+            for benchmark in benchmarks
+            if benchmark.error is None
+        },
+    }
+
+
+def append_history(record: dict[str, Any], path: Path = HISTORY_PATH) -> None:
+    history = load_history(path)
+    history.append(record)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "w") as file:
+        json.dump(history, file, indent=2)
+
+
+def find_regressions(
+    record: dict[str, Any],
+    history: list[dict[str, Any]],
+    threshold: float = 1.5,
+    window: int = 5,
+) -> list[Regression]:
+    """Compares each median against the median of its last `window` recorded medians"""
+    regressions = list[Regression]()
+
+    for day, parts in record["results"].items():
+        for part, stats in parts.items():
+            previous = [
+                entry["results"][day][part]["median"]
+                for entry in history
+                if part in entry["results"].get(day, {})
+            ][-window:]
+
+            if not previous:
+                continue
+
+            baseline = statistics.median(previous)
+
+            if stats["median"] < NOISE_FLOOR_SECONDS and baseline < NOISE_FLOOR_SECONDS:
+                continue
+            elif stats["median"] > baseline * threshold:
+                regressions.append(Regression(day, part, baseline, stats["median"]))
+
+    return regressions
+
+
+def format_benchmark(benchmark: DayBenchmark) -> list[str]:
+    name = benchmark.name
+
+    if benchmark.error is not None:
+        return [f"{name:<12} {'error':<10} {benchmark.error}"]
+
+    lines = list[str]()
+
+    for part in benchmark.parts.values():
+        if part.error is not None:
+            lines.append(f"{name:<12} {part.part:<10} {part.error}")
+        else:
+            lines.append(
+                f"{name:<12} {part.part:<10} median {part.median:>10.4f}s  p95 {part.p95:>10.4f}s"
+            )
+
+    return lines
+
+
+def different_answers(baseline: DayBenchmark, other: DayBenchmark) -> list[str]:
+    """The parts whose answers differ between two ways of running a day, which matters most for generated inputs without golden answers"""
+    return [
+        name
+        for name, part in baseline.parts.items()
+        if name != "parse"
+        and part.error is None
+        and (other_part := other.parts.get(name)) is not None
+        and other_part.error is None
+        and normalize(part.answer) != normalize(other_part.answer)
+    ]
+
+
+def format_speedup(baseline: DayBenchmark, other: DayBenchmark, label: str = "mypyc") -> list[str]:
+    lines = list[str]()
+
+    for name, part in baseline.parts.items():
+        if (other_part := other.parts.get(name)) is None or not part.samples or not other_part.samples:
+            continue
+
+        lines.append(
+            f"{baseline.name:<12} {name:<10} {label} speed-up {part.median / other_part.median:>6.2f}x"
+            f"  ({part.median:.4f}s -> {other_part.median:.4f}s)"
+        )
+
+    for name in different_answers(baseline, other):
+        lines.append(
+            f"{other.name:<12} {name:<10} DIFFERENT ANSWER {other.parts[name].answer!r}, "
+            f"expected {baseline.parts[name].answer!r}"
+        )
+
+    return lines
+
+
+def format_regression(regression: Regression) -> str:
+    return (
+        f"REGRESSION {regression.day} {regression.part}: "
+        f"{regression.baseline:.4f}s -> {regression.median:.4f}s ({regression.ratio:.2f}x)"
+    )
+
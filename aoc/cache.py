@@ -0,0 +1,129 @@
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from aoc.answers import normalize
+from aoc.days import ROOT, Day
+from aoc.files import content_key, evict_least_recent
+from aoc.runner import DayResult
+
+CACHE_DIR = ROOT / ".aoc" / "results"
+DEFAULT_MAX_BYTES = 16 << 20
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+
+
+class ResultCache:
+    """Answers of previous runs stored as one small JSON file per key.
+
+    The least recently used entries are evicted once the entries take up more
+    than `max_bytes`; a hit refreshes an entry's modification time. Hit and
+    miss counts are kept across runs in `stats.json`.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.entries = directory / "entries"
+        self.stats_path = directory / "stats.json"
+        self.max_bytes = max_bytes
+
+    def get(self, day: Day, parts: Optional[Iterable[str]] = None) -> Optional[DayResult]:
+        """Returns the cached answers of a day, or None when any requested part is missing"""
+        try:
+            path = self.entries / f"{content_key(day)}.json"
+
+            with open(path) as file:
+                entry = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            entry = None
+
+        wanted = set(parts) if parts else None
+
+        if entry is None:
+            hit = False
+        elif wanted is None:
+            # Without a selection the full set of entry points is only known after an import
+            hit = entry["complete"]
+        else:
+            hit = wanted <= entry["answers"].keys()
+
+        if not hit:
+            self.count("misses")
+            return None
+
+        self.count("hits")
+        os.utime(path)
+
+        return DayResult.from_answers(
+            day,
+            {part: answer for part, answer in entry["answers"].items() if wanted is None or part in wanted},
+        )
+
+    def put(self, result: DayResult, complete: bool) -> None:
+        """Stores the answers of a finished day; failed or wrong days are not cached"""
+        if not result.ok or result.cached:
+            return
+
+        path = self.entries / f"{content_key(result.day)}.json"
+        answers = {part.part: normalize(part.answer) for part in result.parts}
+
+        try:
+            with open(path) as file:
+                previous = json.load(file)
+
+            answers = previous["answers"] | answers
+            complete = complete or previous["complete"]
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+        self.entries.mkdir(parents=True, exist_ok=True)
+
+        with open(path, "w") as file:
+            json.dump({"day": result.day.name, "complete": complete, "answers": answers}, file)
+
+        evict_least_recent(self.entries, "*.json", self.max_bytes)
+
+    def count(self, field: str) -> None:
+        try:
+            with open(self.stats_path) as file:
+                counts = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            counts = {}
+
+        counts[field] = counts.get(field, 0) + 1
+        self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.stats_path, "w") as file:
+            json.dump(counts, file)
+
+    def stats(self) -> CacheStats:
+        try:
+            with open(self.stats_path) as file:
+                counts = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            counts = {}
+
+        paths = list(self.entries.glob("*.json"))
+        return CacheStats(
+            counts.get("hits", 0),
+            counts.get("misses", 0),
+            len(paths),
+            sum(path.stat().st_size for path in paths),
+        )
+
+    def clear(self) -> None:
+        for path in self.entries.glob("*.json"):
+            path.unlink()
+
+        self.stats_path.unlink(missing_ok=True)
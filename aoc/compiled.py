@@ -0,0 +1,49 @@
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from aoc.days import COMPILED_DIR, ROOT, Day, compiled_path
+
+# Days with hot, fully typed inner loops that get faster compiled; `bench --compare-compiled` shows by how much
+COMPILED_DAYS = (
+    "2023/day14",
+    "2023/day17",
+    "2024/day6",
+    "2024/day9",
+)
+
+
+class BuildError(Exception):
+    pass
+
+
+def build(day: Day, directory: Path = COMPILED_DIR) -> Path:
+    """Compiles a day with mypyc into an extension module named like its module.
+
+    The source is copied under the day's module name first, since mypyc names
+    the extension after the file and `aoc.days.load` looks it up by that name.
+    mypyc type checks the module too, so a day has to pass mypy to compile.
+    """
+    try:
+        import mypyc  # noqa: F401
+    except ImportError:
+        raise BuildError("mypyc is not installed, install mypy to compile days") from None
+
+    directory.mkdir(parents=True, exist_ok=True)
+    source = directory / f"{day.module_name}.py"
+    shutil.copyfile(day.path, source)
+
+    process = subprocess.run(
+        [sys.executable, "-m", "mypyc", source.name],
+        cwd=directory,
+        env={**os.environ, "MYPYPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+    )
+
+    if process.returncode != 0 or (path := compiled_path(day, directory)) is None:
+        raise BuildError((process.stdout + process.stderr).strip())
+
+    return path
@@ -0,0 +1,39 @@
+import contextlib
+from collections import Counter
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_recording: ContextVar[Optional[Counter[str]]] = ContextVar("counters", default=None)
+
+
+def counters() -> Counter[str]:
+    """The counts of the running part (states expanded, cache hits, ...), to add to directly.
+
+    Outside of `counting`, e.g. when a day is run directly, a throwaway Counter
+    is returned. Fetching it and updating a Counter cost more than the body of
+    the tightest loops, so count those in local ints and add them once, or
+    fetch it once per part and pass it down.
+    """
+    counts = _recording.get()
+    return counts if counts is not None else Counter()
+
+
+def high_water(counts: Counter[str], name: str, value: int) -> None:
+    """Keeps the largest value seen, e.g. of a queue's length"""
+    if value > counts[name]:
+        counts[name] = value
+
+
+@contextlib.contextmanager
+def counting(counts: Counter[str]) -> Iterator[Counter[str]]:
+    """Collects the counts updated within the block into `counts`"""
+    token = _recording.set(counts)
+
+    try:
+        yield counts
+    finally:
+        _recording.reset(token)
+
+
+def format_counters(counts: Counter[str]) -> list[str]:
+    return [f"{'':<12} {'':<10} {name:<20} {value:>11,}" for name, value in counts.items()]
@@ -0,0 +1,95 @@
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from aoc.days import ROOT, Day, discover
+from aoc.pool import preload
+from aoc.runner import as_json, describe, run_day
+
+SOCKET_PATH = ROOT / ".aoc" / "daemon.sock"
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Answers newline-delimited JSON requests until the client hangs up"""
+
+    server: "Daemon"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                response = self.server.solve(json.loads(line))
+            except Exception as e:
+                response = {"error": describe(e)}
+
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Daemon(socketserver.ThreadingUnixStreamServer):
+    """Serves solves from a pool of workers that have already imported every day.
+
+    A request is a JSON object with `year`, `day` and optionally `part` (a name
+    or a list of names) and `input` (a path, defaulting to the day's input.txt).
+    The response is the day's result as produced by `aoc.runner.as_json`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, executor: Executor, days: Iterable[Day]) -> None:
+        self.executor = executor
+        self.days = {(day.year, day.day): day for day in days}
+        super().__init__(str(path), RequestHandler)
+
+    def solve(self, request: dict[str, Any]) -> dict[str, Any]:
+        if (day := self.days.get((request["year"], request["day"]))) is None:
+            return {"error": f"Unknown day {request['year']}/day{request['day']}"}
+
+        parts = request.get("part")
+        parts = [parts] if isinstance(parts, str) else parts
+        input_path = Path(request["input"]).resolve() if request.get("input") else None
+
+        # The day's own input is still checked against its golden answers
+        if input_path == day.input_path.resolve():
+            input_path = None
+
+        result = self.executor.submit(run_day, day, parts, None, False, input_path).result()
+        return as_json(result)
+
+
+def serve(path: Path = SOCKET_PATH, workers: Optional[int] = None) -> None:
+    days = discover()
+    workers = workers or os.cpu_count() or 1
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    # Exit through the cleanup below when stopped by a service manager too
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    with ProcessPoolExecutor(workers, initializer=preload, initargs=(days,)) as executor:
+        # Start every worker now rather than on the first requests
+        for future in [executor.submit(os.getpid) for _ in range(workers)]:
+            future.result()
+
+        try:
+            with Daemon(path, executor, days) as daemon:
+                daemon.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def query(requests: Iterable[dict[str, Any]], path: Path = SOCKET_PATH) -> Iterator[dict[str, Any]]:
+    """Sends each request over one connection, yielding the responses in order"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+
+        with sock.makefile("rwb") as stream:
+            for request in requests:
+                stream.write(json.dumps(request).encode() + b"\n")
+                stream.flush()
+                yield json.loads(stream.readline())
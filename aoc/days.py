@@ -0,0 +1,130 @@
+import importlib.machinery
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPILED_DIR = ROOT / ".aoc" / "compiled"
+
+SOLVER_FILES = ("main.py", "solve.py")
+PART_ENTRY_POINTS = ("part1", "part2", "part1and2")
+FALLBACK_ENTRY_POINT = "solve"
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/day{self.day}"
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_{self.year}_day{self.day}"
+
+    @property
+    def input_path(self) -> Path:
+        return self.path.parent / "input.txt"
+
+
+def discover(
+    years: Optional[Iterable[int]] = None,
+    days: Optional[Iterable[int]] = None,
+    root: Path = ROOT,
+) -> list[Day]:
+    years = set(years) if years else None
+    days = set(days) if days else None
+    found = list[Day]()
+
+    for year_dir in root.iterdir():
+        if not re.fullmatch(r"20\d\d", year_dir.name) or not year_dir.is_dir():
+            continue
+        elif years is not None and int(year_dir.name) not in years:
+            continue
+
+        for day_dir in year_dir.iterdir():
+            if not (match := re.fullmatch(r"day(\d+)", day_dir.name)):
+                continue
+            elif days is not None and int(match.group(1)) not in days:
+                continue
+
+            for solver_file in SOLVER_FILES:
+                if (path := day_dir / solver_file).is_file():
+                    found.append(Day(int(year_dir.name), int(match.group(1)), path))
+                    break
+
+    return sorted(found)
+
+
+def compiled_path(day: Day, directory: Path = COMPILED_DIR) -> Optional[Path]:
+    """The day's mypyc-built extension module, if one was built from its current source"""
+    source = directory / f"{day.module_name}.py"
+
+    # A build of an older version of the day would silently run stale code
+    if not source.is_file() or source.read_bytes() != day.path.read_bytes():
+        return None
+
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+        if (path := directory / f"{day.module_name}{suffix}").is_file():
+            return path
+
+    return None
+
+
+def is_compiled(module: ModuleType) -> bool:
+    return str(getattr(module, "__file__", "")).endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES))
+
+
+def load(day: Day, compiled: bool = False) -> ModuleType:
+    """Imports a day, from its compiled build when `compiled` and one exists"""
+    path = (compiled_path(day) if compiled else None) or day.path
+
+    # Switching between the compiled and interpreted module replaces the cached one
+    if (module := sys.modules.get(day.module_name)) is not None and module.__file__ == str(path):
+        return module
+
+    spec = importlib.util.spec_from_file_location(day.module_name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+
+    # Registered before executing so dataclasses and pickling can resolve it
+    sys.modules[day.module_name] = module
+
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.module_name]
+        raise
+
+    return module
+
+
+def entry_points(module: ModuleType) -> dict[str, Callable[[Any], Any]]:
+    """Returns the solver functions of a day, keyed by name.
+
+    `solve` is only treated as an entry point when a module has no `partN`
+    functions since some days use that name for a helper.
+    """
+
+    def defined(name: str) -> bool:
+        func = getattr(module, name, None)
+        return callable(func) and getattr(func, "__module__", None) == module.__name__
+
+    names = [name for name in PART_ENTRY_POINTS if defined(name)]
+
+    if not names and defined(FALLBACK_ENTRY_POINT):
+        names.append(FALLBACK_ENTRY_POINT)
+
+    return {name: getattr(module, name) for name in names}
+
+
+def parser(module: ModuleType) -> Optional[Callable[[Any], Any]]:
+    func = getattr(module, "parse", None)
+    return func if callable(func) else None
@@ -0,0 +1,32 @@
+from aoc.grid import Vec2
+
+# Directions are small ints that index straight into the tables below, so an
+# inner loop does a tuple lookup instead of matching on an enum or a string.
+# They go clockwise from up, which makes every turn a rotation of the table.
+Direction = int
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTIONS: tuple[Direction, ...] = (UP, RIGHT, DOWN, LEFT)
+
+# (row, col) offset of a single step in each direction
+DELTAS: tuple[Vec2, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIRECTIONS_BY_DELTA = {delta: direction for direction, delta in enumerate(DELTAS)}
+
+TURN_LEFT: tuple[Direction, ...] = (LEFT, UP, RIGHT, DOWN)
+TURN_RIGHT: tuple[Direction, ...] = (RIGHT, DOWN, LEFT, UP)
+REVERSE: tuple[Direction, ...] = (DOWN, LEFT, UP, RIGHT)
+
+Move = tuple[int, int, Direction]  # row offset, col offset, direction afterwards
+
+
+def transitions(table: dict[str, tuple[tuple[Direction, ...], ...]]) -> dict[int, tuple[tuple[Move, ...], ...]]:
+    """Expands `tile -> outgoing directions for each incoming direction` into moves.
+
+    The result is keyed by the tile's byte as stored in a Grid and indexed by
+    the incoming direction, giving the step to take for each outgoing one.
+    """
+    return {
+        ord(tile): tuple(
+            tuple((*DELTAS[direction], direction) for direction in outgoing) for outgoing in by_direction
+        )
+        for tile, by_direction in table.items()
+    }
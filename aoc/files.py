@@ -0,0 +1,37 @@
+import hashlib
+import sys
+from pathlib import Path
+from typing import Optional
+
+from aoc.days import Day
+
+PACKAGE_DIR = Path(__file__).parent
+
+
+def content_key(day: Day, input_path: Optional[Path] = None) -> str:
+    """SHA-256 of the input, the solver source, the `aoc` package source and the interpreter version.
+
+    Days import shared helpers (grids, directions, inputs) from `aoc` and
+    models may hold their instances, so editing any module of the package
+    invalidates every key rather than tracking which day imports what.
+    """
+    digest = hashlib.sha256()
+
+    for path in (input_path or day.input_path, day.path, *sorted(PACKAGE_DIR.glob("*.py"))):
+        with open(path, "rb") as file:
+            digest.update(hashlib.file_digest(file, "sha256").digest())
+
+    digest.update(sys.version.encode())
+    return digest.hexdigest()
+
+
+def evict_least_recent(directory: Path, pattern: str, max_bytes: int) -> None:
+    """Deletes the oldest matching files by modification time until the rest fit in `max_bytes`"""
+    paths = sorted(directory.glob(pattern), key=lambda path: path.stat().st_mtime, reverse=True)
+    size = 0
+
+    for path in paths:
+        size += path.stat().st_size
+
+        if size > max_bytes:
+            path.unlink(missing_ok=True)
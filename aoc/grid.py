@@ -0,0 +1,151 @@
+from typing import Iterable, Iterator, Optional, Union
+
+Vec2 = tuple[int, int]
+
+UDLR: tuple[Vec2, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))  # UP, DOWN, LEFT, RIGHT
+
+# Translation table for grids of single digits, e.g. heights or heat loss
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+class Grid:
+    """A dense 2D grid of bytes stored row-major in a flat bytearray.
+
+    Positions are (row, col) tuples like the dict-based maps this replaces, but
+    each cell costs a single byte and lookups are plain index math instead of
+    hashing a tuple. The raw buffer is exposed as `cells` for hot loops that
+    want to work with flat indices directly. A frozen grid is backed by bytes
+    instead, so it can be shared safely and any write raises a TypeError.
+    """
+
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: Optional[Union[bytearray, bytes]] = None,
+        fill: int = 0,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.cells = cells if cells is not None else bytearray([fill]) * (width * height)
+
+        assert len(self.cells) == width * height
+
+    @classmethod
+    def parse(cls, lines: Iterable[str], table: Optional[bytes] = None) -> "Grid":
+        """Reads lines up to the first blank one, optionally translating each byte through `table`.
+
+        Every row must be as wide as the first, or a ValueError names the row.
+        """
+        cells = bytearray()
+        width, height = 0, 0
+
+        for line in lines:
+            if not (line := line.strip()):
+                break
+
+            row = line.encode()
+
+            if height == 0:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(f"Grid row {height} is {len(row)} wide, expected {width} like the first row")
+
+            cells += row.translate(table) if table is not None else row
+            height += 1
+
+        return cls(width, height, cells)
+
+    def index(self, pos: Vec2) -> int:
+        row, col = pos
+
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(pos)
+
+        return row * self.width + col
+
+    def position(self, index: int) -> Vec2:
+        return divmod(index, self.width)
+
+    def __contains__(self, pos: Vec2) -> bool:
+        row, col = pos
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, pos: Vec2) -> int:
+        return self.cells[self.index(pos)]
+
+    def __setitem__(self, pos: Vec2, value: int) -> None:
+        # A frozen grid's bytes raise TypeError here, which is the point of freezing it
+        self.cells[self.index(pos)] = value  # type: ignore[index]
+
+    def get(self, pos: Vec2, default: Optional[int] = None) -> Optional[int]:
+        row, col = pos
+
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.cells[row * self.width + col]
+
+        return default
+
+    def char(self, pos: Vec2) -> str:
+        return chr(self[pos])
+
+    def neighbors(self, pos: Vec2) -> Iterator[Vec2]:
+        """Yields the in-bounds positions above, below, left and right of `pos`"""
+        row, col = pos
+
+        for row_offset, col_offset in UDLR:
+            adj_row, adj_col = row + row_offset, col + col_offset
+
+            if 0 <= adj_row < self.height and 0 <= adj_col < self.width:
+                yield adj_row, adj_col
+
+    def positions(self) -> Iterator[Vec2]:
+        for row in range(self.height):
+            for col in range(self.width):
+                yield row, col
+
+    def find(self, value: int) -> Iterator[Vec2]:
+        index = self.cells.find(value)
+
+        while index != -1:
+            yield self.position(index)
+            index = self.cells.find(value, index + 1)
+
+    def copy(self) -> "Grid":
+        """Returns a mutable copy, which is also how a frozen grid is thawed"""
+        return Grid(self.width, self.height, bytearray(self.cells))
+
+    def freeze(self) -> "Grid":
+        return Grid(self.width, self.height, bytes(self.cells))
+
+    def transpose(self) -> "Grid":
+        """Returns a grid indexed by (col, row), for days that use (x, y) positions"""
+        cells = bytearray(len(self.cells))
+
+        for row in range(self.height):
+            cells[row :: self.height] = self.cells[row * self.width : (row + 1) * self.width]
+
+        return Grid(self.height, self.width, cells)
+
+    def snapshot(self) -> bytes:
+        """An immutable, hashable copy of the cells for remembering seen states"""
+        return bytes(self.cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+
+        return (self.width, self.height, self.cells) == (other.width, other.height, other.cells)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.cells[row * self.width : (row + 1) * self.width].decode("latin-1")
+            for row in range(self.height)
+        )
@@ -0,0 +1,101 @@
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Optional
+
+from aoc.days import ROOT, Day
+
+TOP_IMPORTS = 5
+
+# Written to stderr between the runner's own imports and the day's
+MARKER = "-- aoc day import --"
+
+# What the child process runs: import the runner, then load the day and time it
+PROGRAM = f"""
+import sys, time
+from pathlib import Path
+from aoc.days import Day, load
+day = Day({{year}}, {{day}}, Path({{path!r}}))
+print({MARKER!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+load(day)
+print(time.perf_counter() - start)
+"""
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+@dataclass
+class ImportCost:
+    name: str
+    self_seconds: float
+    cumulative_seconds: float
+
+
+@dataclass
+class DayImports:
+    day: Day
+    seconds: float = 0.0
+    imports: list[ImportCost] = field(default_factory=list[ImportCost])
+    error: Optional[str] = None
+
+
+def measure_imports(day: Day) -> DayImports:
+    """Imports a day in a fresh interpreter under `-X importtime`.
+
+    Each day gets its own process so modules another day already imported
+    aren't free. `seconds` covers the whole day module, including its own
+    top-level code; `imports` are the modules it imported directly, each with
+    the cumulative cost of everything they pulled in.
+    """
+    report = DayImports(day)
+    program = PROGRAM.format(year=day.year, day=day.day, path=str(day.path))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", program],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+
+    if process.returncode != 0:
+        report.error = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else "import failed"
+        return report
+
+    report.seconds = float(process.stdout.strip().splitlines()[-1])
+    lines = process.stderr.split(MARKER, 1)[1].splitlines()
+    matches = [match for line in lines if (match := IMPORT_TIME_LINE.match(line))]
+
+    # Children are listed before their parent and indented deeper, so the day's
+    # direct imports are the least indented lines
+    depth = min((len(match.group(3)) for match in matches), default=0)
+    report.imports = sorted(
+        (
+            ImportCost(match.group(4), int(match.group(1)) / 1e6, int(match.group(2)) / 1e6)
+            for match in matches
+            if len(match.group(3)) == depth
+        ),
+        key=lambda cost: cost.cumulative_seconds,
+        reverse=True,
+    )
+
+    return report
+
+
+def format_imports(report: DayImports, budget: Optional[float] = None, limit: int = TOP_IMPORTS) -> list[str]:
+    name = report.day.name
+
+    if report.error is not None:
+        return [f"{name:<12} {'error':<10} {report.error}"]
+
+    line = f"{name:<12} {'import':<10} {report.seconds:>10.4f}s"
+
+    if budget is not None and report.seconds > budget:
+        line += f"  OVER BUDGET of {budget:.4f}s"
+
+    lines = [line]
+
+    for cost in report.imports[:limit]:
+        lines.append(f"{'':<12} {'':<10} {cost.cumulative_seconds:>10.4f}s  {cost.name}")
+
+    return lines
@@ -0,0 +1,76 @@
+import gzip
+import io
+import lzma
+import mmap
+from pathlib import Path
+from typing import IO, Iterator, Union
+
+Buffer = Union[mmap.mmap, bytes]
+
+COMPRESSIONS = ("gz", "xz", "zst")
+
+
+def open_text(path: Union[str, Path], mode: str = "r") -> io.TextIOWrapper:
+    """Opens an input as text, (de)compressing it on the fly if it ends in .gz, .xz or .zst.
+
+    Data streams through the decompressor as the parser reads, so a large
+    compressed input is never written out or held in memory whole. zstd needs
+    the `zstandard` package before Python 3.14.
+    """
+    suffix = Path(path).suffix
+
+    if suffix == ".gz":
+        return io.TextIOWrapper(gzip.GzipFile(path, mode))
+    elif suffix == ".xz":
+        return io.TextIOWrapper(lzma.LZMAFile(path, mode))
+    elif suffix == ".zst":
+        try:
+            from compression import zstd  # type: ignore[import-not-found]
+        except ImportError:
+            try:
+                import zstandard as zstd  # type: ignore[import-not-found, no-redef]
+            except ImportError:
+                raise ImportError(f"reading or writing {path} needs the zstandard package") from None
+
+        return io.TextIOWrapper(zstd.open(path, f"{mode}b"))
+
+    return io.TextIOWrapper(open(path, f"{mode}b"))
+
+
+def map_input(file: IO) -> Buffer:
+    """Memory-maps the whole of an open input file read-only.
+
+    The mapping holds its own handle, so it stays valid after `file` is closed
+    and can be returned from a day's parse step. Streams that can't be mapped
+    (pipes, empty files, compressed inputs) are read into bytes instead.
+    """
+    # A compressed stream's fileno is that of the compressed file underneath
+    if isinstance(getattr(getattr(file, "buffer", file), "raw", None), io.FileIO):
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            pass
+
+    data = getattr(file, "buffer", file).read()
+    return data.encode() if isinstance(data, str) else data
+
+
+def load(path: Union[str, Path]) -> Buffer:
+    """Memory-maps the file at `path`, for callers that don't already have it open"""
+    with open_text(path) as file:
+        return map_input(file)
+
+
+def lines(buffer: Buffer) -> Iterator[memoryview]:
+    """Yields each line of the buffer as a view without its line ending, copying nothing"""
+    view = memoryview(buffer)
+    start, size = 0, len(buffer)
+
+    while start < size:
+        if (end := buffer.find(b"\n", start)) == -1:
+            end = size
+
+        line_end = end - 1 if end > start and view[end - 1] == ord("\r") else end
+        yield view[start:line_end]
+
+        start = end + 1
@@ -0,0 +1,236 @@
+import contextlib
+import dataclasses
+import sys
+import threading
+import tracemalloc
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator, Optional
+
+from aoc.days import Day
+
+TOP_ALLOCATIONS = 5
+SAMPLE_INTERVAL_SECONDS = 0.01
+MIN_SNAPSHOT_GROWTH = 1 << 18
+RECORD_SAMPLES = 20_000
+UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+@dataclass
+class Allocation:
+    site: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryUsage:
+    peak: int = 0
+    allocations: list[Allocation] = field(default_factory=list[Allocation])
+
+
+def parse_size(text: str) -> int:
+    """Parses a byte count such as `512M` or `2G` (binary units)"""
+    text = text.strip().upper().removesuffix("B").removesuffix("I")
+    unit = text[-1:] if text[-1:] in UNITS else ""
+    return int(float(text.removesuffix(unit)) * UNITS[unit])
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f}{unit}" if unit != "B" else f"{size}B"
+
+        size /= 1024  # type: ignore[assignment]
+
+    return f"{size:.1f}GiB"
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, limit: int = TOP_ALLOCATIONS) -> list[Allocation]:
+    # Leave out the runner and the tracing machinery itself, including the
+    # WeakSets threading keeps, which live in the private _weakrefset module
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, module.__file__ or "")
+        for module in (tracemalloc, threading, contextlib, sys.modules[__name__], sys.modules["aoc.runner"])
+    ] + [
+        tracemalloc.Filter(False, str(Path(weakref.__file__).with_name("_weakrefset.py"))),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ])
+
+    return [
+        Allocation(f"{Path(frame.filename).name}:{frame.lineno}", stat.size, stat.count)
+        for stat in snapshot.statistics("lineno")[:limit]
+        for frame in [stat.traceback[0]]
+    ]
+
+
+@contextlib.contextmanager
+def traced(usage: MemoryUsage, limit: int = TOP_ALLOCATIONS) -> Iterator[MemoryUsage]:
+    """Traces the block's allocations, filling in its peak and top allocation sites.
+
+    Peak memory is counted from the start of the block, so a part's share of a
+    parsed model is not included. By the time the block returns most of what
+    it allocated has been freed, so the sites come from a watcher thread that
+    snapshots the heap each time it grows by a tenth past the last snapshot.
+    """
+    started = not tracemalloc.is_tracing()
+
+    if started:
+        tracemalloc.start()
+
+    tracemalloc.reset_peak()
+    baseline, peak = tracemalloc.get_traced_memory()
+    allocations: Optional[list[Allocation]] = None
+    done = threading.Event()
+
+    def watch() -> None:
+        nonlocal peak, allocations
+        snapshot_size = baseline
+
+        while not done.wait(SAMPLE_INTERVAL_SECONDS):
+            current, current_peak = tracemalloc.get_traced_memory()
+
+            if current - baseline <= max((snapshot_size - baseline) * 1.1, MIN_SNAPSHOT_GROWTH):
+                continue
+
+            # Taking the snapshot allocates too, which must not count towards the peak
+            peak = max(peak, current_peak)
+            allocations = top_allocations(tracemalloc.take_snapshot(), limit)
+            snapshot_size = current
+            tracemalloc.reset_peak()
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+
+    try:
+        yield usage
+    finally:
+        done.set()
+        watcher.join()
+
+        usage.peak = max(peak, tracemalloc.get_traced_memory()[1]) - baseline
+        usage.allocations = allocations if allocations is not None else top_allocations(tracemalloc.take_snapshot(), limit)
+
+        if started:
+            tracemalloc.stop()
+
+
+def format_memory(day: Day, part: str, usage: MemoryUsage, budget: Optional[int] = None) -> list[str]:
+    line = f"{day.name:<12} {part:<10} peak {format_size(usage.peak)}"
+
+    if budget is not None and usage.peak > budget:
+        line += f"  OVER BUDGET of {format_size(budget)}"
+
+    lines = [line]
+
+    for allocation in usage.allocations:
+        lines.append(
+            f"{'':<12} {'':<10} {format_size(allocation.size):>10} {allocation.count:>10} blocks  {allocation.site}"
+        )
+
+    return lines
+
+
+@dataclass
+class RecordSize:
+    name: str
+    size: float  # bytes per instance, including its __dict__ if it has one
+    slotted: bool
+    unslotted: Optional[float] = None  # bytes per instance of a twin without slots, for slotted records
+
+    @property
+    def saving(self) -> Optional[float]:
+        return self.unslotted - self.size if self.unslotted is not None else None
+
+
+def sample_record(cls: type) -> Any:
+    """An instance of a dataclass with 0 for every required field.
+
+    0 is cached by the interpreter, so the instance owns nothing but itself
+    and whatever its default factories create.
+    """
+    return cls(*[
+        0
+        for record_field in dataclasses.fields(cls)
+        if record_field.init
+        and record_field.default is dataclasses.MISSING
+        and record_field.default_factory is dataclasses.MISSING
+    ])
+
+
+def record_size(cls: type, count: int = RECORD_SAMPLES) -> RecordSize:
+    """Measures the bytes allocated per instance of a dataclass by creating `count` of them.
+
+    The first half of the instances only absorbs one-off allocations (caches,
+    specialized bytecode), which would otherwise inflate small records.
+    """
+    started = not tracemalloc.is_tracing()
+    records = [sample_record(cls)] * count
+    half = count // 2
+
+    if started:
+        tracemalloc.start()
+
+    try:
+        for i in range(half):
+            records[i] = sample_record(cls)
+
+        baseline = tracemalloc.get_traced_memory()[0]
+
+        for i in range(half, count):
+            records[i] = sample_record(cls)
+
+        size = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    return RecordSize(cls.__name__, size / (count - half), not hasattr(records[0], "__dict__"))
+
+
+def unslotted_twin(cls: type) -> type:
+    """A plain dataclass with the same fields as `cls`, whose instances carry a __dict__ like before slots"""
+    return dataclasses.make_dataclass(cls.__name__, [
+        (
+            record_field.name,
+            record_field.type,
+            dataclasses.field(  # type: ignore[call-overload]
+                default=record_field.default,
+                default_factory=record_field.default_factory,
+                init=record_field.init,
+            ),
+        )
+        for record_field in dataclasses.fields(cls)
+    ])
+
+
+def record_sizes(module: ModuleType) -> list[RecordSize]:
+    """Sizes of every dataclass defined in a day's module, and of an unslotted twin of the slotted ones"""
+    sizes = list[RecordSize]()
+
+    for cls in vars(module).values():
+        if not (isinstance(cls, type) and dataclasses.is_dataclass(cls) and cls.__module__ == module.__name__):
+            continue
+
+        sizes.append(size := record_size(cls))
+
+        if size.slotted:
+            size.unslotted = record_size(unslotted_twin(cls)).size
+
+    return sizes
+
+
+def format_record_size(day: Day, record: RecordSize) -> str:
+    layout = "slots" if record.slotted else "__dict__"
+    return (
+        f"{day.name:<12} {record.name:<14} {record.size:>7.1f}B per instance  {layout:<8}"
+        f"  {format_size(int(record.size * 1_000_000))} per million"
+        + (
+            f"  {record.unslotted:.1f}B with __dict__, saves {record.saving:.1f}B"
+            f" ({record.saving / record.unslotted:.0%})"
+            if record.unslotted is not None and record.saving is not None
+            else ""
+        )
+    )
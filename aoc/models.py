@@ -0,0 +1,62 @@
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+from aoc.days import ROOT, Day
+from aoc.files import content_key, evict_least_recent
+
+MODEL_CACHE_DIR = ROOT / ".aoc" / "models"
+DEFAULT_MAX_MODEL_BYTES = 256 << 20
+
+# Returned by ModelCache.load on a miss, since None is a valid model
+MISSING = object()
+
+
+class ModelCache:
+    """Parsed models pickled to disk so repeated runs can skip the parse step.
+
+    Entries are keyed like the result cache, so the parser version is the
+    hash of the day's source and of the `aoc` package: any edit to the day,
+    or to a helper whose instances a model may hold such as `aoc.grid.Grid`,
+    re-parses rather than unpickling a stale layout. Models that
+    can't be pickled, such as memory-mapped inputs, are simply never cached.
+    The least recently used models are evicted beyond `max_bytes`.
+    """
+
+    def __init__(self, directory: Path = MODEL_CACHE_DIR, max_bytes: int = DEFAULT_MAX_MODEL_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, day: Day, input_path: Optional[Path] = None) -> Path:
+        return self.directory / f"{content_key(day, input_path)}.pickle"
+
+    def load(self, day: Day, input_path: Optional[Path] = None) -> Any:
+        """Returns the cached model, or MISSING. Day modules must be loaded first."""
+        try:
+            path = self.path(day, input_path)
+
+            with open(path, "rb") as file:
+                model = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return MISSING
+
+        os.utime(path)
+        return model
+
+    def store(self, day: Day, model: Any, input_path: Optional[Path] = None) -> bool:
+        try:
+            data = pickle.dumps(model, pickle.HIGHEST_PROTOCOL)
+        except (TypeError, AttributeError, pickle.PicklingError):
+            return False
+
+        path = self.path(day, input_path)
+        partial = path.with_suffix(f".{os.getpid()}.tmp")
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with open(partial, "wb") as file:
+            file.write(data)
+
+        partial.replace(path)
+        evict_least_recent(self.directory, "*.pickle", self.max_bytes)
+        return True
@@ -0,0 +1,114 @@
+import contextlib
+import contextvars
+import math
+import os
+import sys
+from collections import Counter
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from aoc.counters import counters, counting
+
+# multiprocessing and concurrent.futures take longer to import than most of the
+# days that fan out take to run, so they're only imported once a pool is needed
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+S = TypeVar("S")
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Chunks per worker, so a worker that draws slow units doesn't finish last by much
+CHUNKS_PER_WORKER = 4
+
+_workers: ContextVar[int] = ContextVar("workers", default=1)
+
+# The shared state of a process pool's worker, sent once by its initializer
+_shared: Any = None
+
+
+def free_threaded() -> bool:
+    """Whether threads run Python in parallel, i.e. a free-threaded build that hasn't re-enabled the GIL"""
+    is_gil_enabled: Callable[[], bool] = getattr(sys, "_is_gil_enabled", lambda: True)
+    return not is_gil_enabled()
+
+
+@contextlib.contextmanager
+def fanning_out(workers: Optional[int] = None) -> Iterator[int]:
+    """Lets `fan_out` within the block spread its units across `workers` (default: CPU count)"""
+    token = _workers.set(workers or os.cpu_count() or 1)
+
+    try:
+        yield _workers.get()
+    finally:
+        _workers.reset(token)
+
+
+def _share(shared: Any) -> None:
+    global _shared
+    _shared = shared
+
+
+def _solve_chunk(solve: Callable[[S, T], R], shared: S, chunk: list[T]) -> tuple[list[R], Counter[str]]:
+    # Phases aren't timed in workers and nested fan-outs run serially; the
+    # counts are collected per chunk and added up by the caller
+    counts = Counter[str]()
+
+    with counting(counts):
+        return [solve(shared, unit) for unit in chunk], counts
+
+
+def _solve_shared_chunk(solve: Callable[[Any, T], R], chunk: list[T]) -> tuple[list[R], Counter[str]]:
+    return _solve_chunk(solve, _shared, chunk)
+
+
+def _executor(workers: int, shared: Any, threaded: bool) -> "Executor":
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if threaded:
+        return ThreadPoolExecutor(max_workers=workers)
+
+    # Solvers live in day modules that were loaded from a path rather than
+    # imported, so workers must be forked to already have them
+    context = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_share, initargs=(shared,))
+
+
+def fan_out(solve: Callable[[S, T], R], shared: S, units: Iterable[T]) -> list[R]:
+    """`solve(shared, unit)` for every unit, in order, spread across a pool within `fanning_out`.
+
+    On free-threaded builds the units run on a thread pool that reads
+    `shared` in place, so it must not be modified other than filling in
+    caches whose entries never change once set. Elsewhere they run on a
+    process pool, which gets `shared` pickled once per worker rather than once
+    per unit; `solve` must then be a module level function. Each worker
+    then fills its own copy of any cache in `shared`, so counts that depend
+    on it (cache hits and misses) are totals over the workers' caches and
+    not comparable to a serial run. Outside of `fanning_out`, e.g. when a day
+    is run directly, the units run serially.
+    """
+    units = list(units)
+    workers = min(_workers.get(), len(units))
+
+    if workers <= 1:
+        return [solve(shared, unit) for unit in units]
+
+    size = math.ceil(len(units) / (workers * CHUNKS_PER_WORKER))
+    chunks = [units[start : start + size] for start in range(0, len(units), size)]
+    results = list[R]()
+    counts = counters()
+    threaded = free_threaded()
+
+    with _executor(workers, shared, threaded) as executor:
+        if threaded:
+            # Threads would otherwise inherit the caller's context on some builds
+            done = executor.map(lambda chunk: contextvars.Context().run(_solve_chunk, solve, shared, chunk), chunks)
+        else:
+            done = executor.map(_solve_shared_chunk, [solve] * len(chunks), chunks)
+
+        for chunk_results, chunk_counts in done:
+            results += chunk_results
+            counts.update(chunk_counts)
+
+    return results
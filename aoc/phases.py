@@ -0,0 +1,57 @@
+import contextlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+
+@dataclass
+class PhaseTiming:
+    name: str
+    seconds: float = 0.0
+    calls: int = 0
+
+
+Phases = dict[str, PhaseTiming]
+
+_recording: ContextVar[Optional[Phases]] = ContextVar("phases", default=None)
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Marks the block as a named phase (e.g. "build index", "search") of the running part.
+
+    Blocks with the same name add up, so a phase can be marked inside a loop,
+    and a phase nested in another counts towards both. Outside of `recording`,
+    e.g. when a day is run directly, nothing is timed.
+    """
+    if (phases := _recording.get()) is None:
+        yield
+        return
+
+    timing = phases.get(name) or phases.setdefault(name, PhaseTiming(name))
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        timing.seconds += time.perf_counter() - start
+        timing.calls += 1
+
+
+@contextlib.contextmanager
+def recording(phases: Phases) -> Iterator[Phases]:
+    """Collects the phases marked within the block into `phases`, in the order they first start"""
+    token = _recording.set(phases)
+
+    try:
+        yield phases
+    finally:
+        _recording.reset(token)
+
+
+def format_phases(phases: Phases) -> list[str]:
+    return [
+        f"{'':<12} {'':<10} {timing.name:<20} {timing.seconds:>10.4f}s" + (f"  {timing.calls} calls" if timing.calls > 1 else "")
+        for timing in phases.values()
+    ]
@@ -0,0 +1,55 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterable, Optional
+
+from aoc.backends import BACKENDS
+from aoc.days import Day, load
+from aoc.models import ModelCache
+from aoc.runner import DayResult, run_day
+
+
+def preload(days: list[Day], compiled: bool = False) -> None:
+    """Imports every day up front so solves never pay for an import; used as a pool initializer"""
+    for day in days:
+        try:
+            load(day, compiled)
+        except Exception:
+            pass  # Reported when the day is run, like a normal run
+
+
+def longest_first(days: Iterable[Day], timings: dict[str, float]) -> list[Day]:
+    # Days without a recorded timing could be anything, so they go first too
+    return sorted(days, key=lambda day: timings.get(day.name, math.inf), reverse=True)
+
+
+def run_days_parallel(
+    days: Iterable[Day],
+    timings: dict[str, float],
+    parts: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+    model_cache: Optional[ModelCache] = None,
+    compiled: bool = False,
+    sample_dir: Optional[Path] = None,
+    fan_out_workers: Optional[int] = None,
+    backend: str = BACKENDS[0],
+) -> Iterable[DayResult]:
+    """Runs each day in a worker process, yielding results as they finish.
+
+    The executor hands out work in submission order, so submitting the slowest
+    days first keeps them from starting last and dominating total wall time.
+    """
+    parts = list(parts) if parts else None
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_day, day, parts, profile_dir, trace_memory, None, model_cache, compiled, sample_dir, fan_out_workers, backend)
+            for day in longest_first(days, timings)
+        ]
+
+        for future in as_completed(futures):
+            yield future.result()
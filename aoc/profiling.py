@@ -0,0 +1,72 @@
+import contextlib
+import cProfile
+import pstats
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from aoc.days import ROOT, Day
+
+PROFILE_DIR = ROOT / ".aoc" / "profiles"
+TOP_FUNCTIONS = 10
+
+
+@dataclass
+class HotFunction:
+    name: str
+    calls: int
+    own_seconds: float
+    cumulative_seconds: float
+
+
+def profile_path(directory: Path, day: Day, part: str) -> Path:
+    return directory / f"{day.year}-day{day.day:02}-{part}.prof"
+
+
+@contextlib.contextmanager
+def profiled(path: Path) -> Iterator[cProfile.Profile]:
+    """Profiles the block and dumps the stats to `path` for pstats or snakeviz.
+
+    A plain-text report sorted by own time is written next to it as `.txt`.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
+
+        with open(path.with_suffix(".txt"), "w") as file:
+            pstats.Stats(profiler, stream=file).sort_stats("tottime").print_stats()
+
+
+def hot_functions(path: Path, limit: int = TOP_FUNCTIONS) -> list[HotFunction]:
+    """Reads a dumped profile and returns the functions with the most own time"""
+    stats = pstats.Stats(str(path)).stats  # type: ignore[attr-defined]
+    functions = [
+        HotFunction(
+            f"{Path(filename).name}:{line}({name})" if line else name,
+            calls,
+            own_seconds,
+            cumulative_seconds,
+        )
+        for (filename, line, name), (_, calls, own_seconds, cumulative_seconds, _) in stats.items()
+    ]
+
+    functions.sort(key=lambda function: function.own_seconds, reverse=True)
+    return functions[:limit]
+
+
+def format_profile(day: Day, part: str, path: Path, limit: int = TOP_FUNCTIONS) -> list[str]:
+    lines = [f"{day.name:<12} {part:<10} profile {path}"]
+
+    for function in hot_functions(path, limit):
+        lines.append(
+            f"{'':<12} {'':<10} {function.own_seconds:>9.4f}s own"
+            f" {function.cumulative_seconds:>9.4f}s cum {function.calls:>10} calls  {function.name}"
+        )
+
+    return lines
@@ -0,0 +1,298 @@
+import contextlib
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from aoc.answers import load_answers, normalize
+from aoc.backends import BACKENDS, Backend, using
+from aoc.counters import counting, format_counters
+from aoc.days import Day, entry_points, is_compiled, load, parser
+from aoc.inputs import open_text
+from aoc.memory import MemoryUsage, traced
+from aoc.models import MISSING, ModelCache
+from aoc.parallel import fanning_out
+from aoc.phases import Phases, format_phases, recording
+from aoc.profiling import profile_path, profiled
+from aoc.sampling import sample_path, sampled
+
+
+@dataclass
+class PartResult:
+    part: str
+    answer: Any = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+    expected: Any = None
+    correct: Optional[bool] = None  # None when there is no recorded answer
+
+
+@dataclass
+class DayResult:
+    day: Day
+    import_seconds: float = 0.0
+    parse_seconds: Optional[float] = None
+    parts: list[PartResult] = field(default_factory=list[PartResult])
+    error: Optional[str] = None
+    profiles: dict[str, Path] = field(default_factory=dict[str, Path])  # parse or part -> .prof
+    samples: dict[str, Path] = field(default_factory=dict[str, Path])  # parse or part -> .folded stacks
+    memory: dict[str, MemoryUsage] = field(default_factory=dict[str, MemoryUsage])  # parse or part -> usage
+    phases: dict[str, Phases] = field(default_factory=dict[str, Phases])  # parse or part -> phases it marked
+    counters: dict[str, Counter[str]] = field(default_factory=dict[str, Counter[str]])  # parse or part -> counts
+    cached: bool = False
+    model_cached: bool = False  # parse_seconds is then the time to load the model
+    compiled: bool = False
+    backend: str = BACKENDS[0]  # the backend the parts ran on, python unless one took another's path
+    vectorized: bool = False  # whether a part has a vectorized path, whichever backend ran
+
+    @classmethod
+    def from_answers(cls, day: Day, answers: dict[str, Any]) -> "DayResult":
+        """A result for answers that weren't computed by this run, checked like fresh ones"""
+        result = cls(day, cached=True)
+        golden = load_answers(day)
+
+        for name, answer in answers.items():
+            result.parts.append(part := PartResult(name, answer))
+            check_answer(part, golden)
+
+        return result
+
+    @property
+    def peak_memory(self) -> Optional[int]:
+        return max((usage.peak for usage in self.memory.values()), default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and all(
+            part.error is None and part.correct is not False for part in self.parts
+        )
+
+    @property
+    def seconds(self) -> float:
+        return (
+            self.import_seconds
+            + (self.parse_seconds or 0.0)
+            + sum(part.seconds for part in self.parts)
+        )
+
+
+def describe(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def check_answer(part: PartResult, answers: dict[str, Any]) -> None:
+    if part.error is None and part.part in answers:
+        part.expected = answers[part.part]
+        part.correct = normalize(part.answer) == part.expected
+
+
+def run_day(
+    day: Day,
+    parts: Optional[Iterable[str]] = None,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+    input_path: Optional[Path] = None,
+    model_cache: Optional[ModelCache] = None,
+    compiled: bool = False,
+    sample_dir: Optional[Path] = None,
+    fan_out_workers: Optional[int] = None,
+    backend: str = BACKENDS[0],
+) -> DayResult:
+    """Imports, parses and solves a day, timing each step.
+
+    With `profile_dir`, the parse step and each part run under cProfile and
+    their stats are dumped there. With `trace_memory`, their peak memory and
+    top allocation sites are traced. Either overhead is included in the times.
+    With `sample_dir`, their stacks are sampled into collapsed-stack files
+    there, at a small fraction of cProfile's overhead.
+
+    `input_path` replaces the day's input.txt, e.g. with a generated stress
+    input, which may be compressed (.gz, .xz or .zst). Golden answers are only
+    checked against the real input. With `model_cache`, a previously parsed
+    model is loaded instead of parsing. With `compiled`, the day's mypyc build
+    is used when there is a current one. With `fan_out_workers` (0 for the
+    CPU count), parts that fan out over independent units spread them across
+    a thread pool on free-threaded builds and a process pool elsewhere. With
+    `backend` "numpy", days with a vectorized path take it if NumPy is
+    installed.
+    """
+    result = DayResult(day)
+    parts = set(parts) if parts else None
+    answers = load_answers(day) if input_path is None else {}
+    input_path = input_path or day.input_path
+    selected = Backend(backend)
+
+    def measure(name: str) -> contextlib.ExitStack:
+        stack = contextlib.ExitStack()
+        stack.enter_context(recording(result.phases.setdefault(name, {})))
+        stack.enter_context(counting(result.counters.setdefault(name, Counter())))
+        stack.enter_context(using(selected))
+
+        if fan_out_workers is not None:
+            stack.enter_context(fanning_out(fan_out_workers))
+
+        if trace_memory:
+            stack.enter_context(traced(result.memory.setdefault(name, MemoryUsage())))
+
+        if profile_dir is not None:
+            result.profiles[name] = path = profile_path(profile_dir, day, name)
+            stack.enter_context(profiled(path))
+
+        if sample_dir is not None:
+            result.samples[name] = path = sample_path(sample_dir, day, name)
+            stack.enter_context(sampled(path))
+
+        return stack
+
+    # Solvers are littered with debug prints which would drown out the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+
+        try:
+            module = load(day, compiled)
+            result.compiled = is_compiled(module)
+        except Exception as e:
+            result.error = describe(e)
+            return result
+        finally:
+            result.import_seconds = time.perf_counter() - start
+
+        if (parse := parser(module)) is not None:
+            start = time.perf_counter()
+            model = model_cache.load(day, input_path) if model_cache is not None else MISSING
+            result.model_cached = model is not MISSING
+
+            try:
+                if model is MISSING:
+                    with open_text(input_path) as file, measure("parse"):
+                        model = parse(file)
+            except Exception as e:
+                result.error = describe(e)
+                return result
+            finally:
+                result.parse_seconds = time.perf_counter() - start
+
+            if model_cache is not None and not result.model_cached:
+                model_cache.store(day, model, input_path)
+
+        for name, solver in entry_points(module).items():
+            if parts is not None and name not in parts:
+                continue
+
+            part = PartResult(name)
+            start = time.perf_counter()
+
+            try:
+                if parse is not None:
+                    with measure(name):
+                        part.answer = solver(model)
+                else:
+                    with open_text(input_path) as file, measure(name):
+                        part.answer = solver(file)
+            except Exception as e:
+                part.error = describe(e)
+            except KeyboardInterrupt:
+                # Reports how far a runaway part got, with its phases, and skips the rest of the day
+                part.error = "interrupted"
+                result.parts.append(part)
+                break
+            finally:
+                part.seconds = time.perf_counter() - start
+
+            check_answer(part, answers)
+            result.parts.append(part)
+
+    result.vectorized = selected.offered
+
+    if selected.used:
+        result.backend = selected.name
+
+    return result
+
+
+def run_days(
+    days: Iterable[Day],
+    parts: Optional[Iterable[str]] = None,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+    model_cache: Optional[ModelCache] = None,
+    compiled: bool = False,
+    sample_dir: Optional[Path] = None,
+    fan_out_workers: Optional[int] = None,
+    backend: str = BACKENDS[0],
+) -> Iterable[DayResult]:
+    parts = list(parts) if parts else None
+
+    for day in days:
+        yield run_day(day, parts, profile_dir, trace_memory, None, model_cache, compiled, sample_dir, fan_out_workers, backend)
+
+
+def phases_json(phases: Phases) -> list[dict[str, Any]]:
+    return [{"name": timing.name, "seconds": timing.seconds, "calls": timing.calls} for timing in phases.values()]
+
+
+def as_json(result: DayResult) -> dict[str, Any]:
+    """The result as plain JSON values, with answers normalized like golden answers"""
+    return {
+        "day": result.day.name,
+        "import_seconds": result.import_seconds,
+        "parse_seconds": result.parse_seconds,
+        "parse_phases": phases_json(result.phases.get("parse", {})),
+        "parse_counters": dict(result.counters.get("parse", {})),
+        "error": result.error,
+        "backend": result.backend,
+        "parts": [
+            {
+                "part": part.part,
+                "answer": normalize(part.answer),
+                "seconds": part.seconds,
+                "error": part.error,
+                "correct": part.correct,
+                "phases": phases_json(result.phases.get(part.part, {})),
+                "counters": dict(result.counters.get(part.part, {})),
+            }
+            for part in result.parts
+        ],
+    }
+
+
+def format_result(result: DayResult) -> list[str]:
+    name = result.day.name
+
+    if result.cached:
+        lines = list[str]()
+    else:
+        notes = list[str]()
+
+        if result.compiled:
+            notes.append("compiled")
+
+        if result.backend != BACKENDS[0]:
+            notes.append(result.backend)
+
+        lines = [f"{name:<12} {'import':<10} {', '.join(notes):<20} {result.import_seconds:>10.4f}s"]
+
+    if result.parse_seconds is not None:
+        note = "cached model" if result.model_cached else ""
+        lines.append(f"{name:<12} {'parse':<10} {note:<20} {result.parse_seconds:>10.4f}s")
+        lines += format_phases(result.phases.get("parse", {}))
+        lines += format_counters(result.counters.get("parse", Counter()))
+
+    if result.error is not None:
+        lines.append(f"{name:<12} {'error':<10} {result.error}")
+
+    for part in result.parts:
+        answer = part.error if part.error is not None else repr(part.answer)
+        seconds = f"{'cached':>11}" if result.cached else f"{part.seconds:>10.4f}s"
+        line = f"{name:<12} {part.part:<10} {answer:<20} {seconds}"
+
+        if part.correct is False:
+            line += f"  WRONG, expected {part.expected!r}"
+
+        lines.append(line)
+        lines += format_phases(result.phases.get(part.part, {}))
+        lines += format_counters(result.counters.get(part.part, Counter()))
+
+    return lines
@@ -0,0 +1,108 @@
+import contextlib
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Iterator, Optional
+
+from aoc.days import ROOT, Day
+
+SAMPLE_DIR = ROOT / ".aoc" / "flamegraphs"
+SAMPLE_INTERVAL_SECONDS = 0.005
+TOP_FUNCTIONS = 5
+
+
+def sample_path(directory: Path, day: Day, part: str) -> Path:
+    return directory / f"{day.year}-day{day.day:02}-{part}.folded"
+
+
+def frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+@contextlib.contextmanager
+def sampled(path: Path, interval: float = SAMPLE_INTERVAL_SECONDS) -> Iterator[Counter[str]]:
+    """Samples the calling thread's stack every `interval` seconds from a background thread.
+
+    Unlike cProfile nothing is hooked into the sampled code, so hot loops run
+    at full speed and the cost is the same however long the block runs. The
+    stacks are written to `path` in the collapsed format (`a;b;c count`) read
+    by flamegraph.pl, speedscope and inferno, starting below the block.
+    Samples taken while context managers around the block are entered or
+    exited, such as the runner's ExitStack unwinding, are left out.
+    """
+    thread = threading.get_ident()
+    stacks = Counter[str]()
+    done = threading.Event()
+
+    # Frames already on the stack belong to whoever entered the block; holding
+    # them keeps their ids from being reused by frames inside it
+    outer = list[FrameType]()
+    frame: Optional[FrameType] = sys._getframe()
+
+    while frame is not None:
+        outer.append(frame)
+        frame = frame.f_back
+
+    outer_ids = {id(frame) for frame in outer}
+
+    def sample() -> None:
+        while not done.wait(interval):
+            frames = list[FrameType]()
+            frame = sys._current_frames().get(thread)
+
+            while frame is not None and id(frame) not in outer_ids:
+                frames.append(frame)
+                frame = frame.f_back
+
+            # The block's own code is never called from contextlib directly
+            if frames and frames[-1].f_code.co_filename != contextlib.__file__:
+                stacks[";".join(frame_name(frame) for frame in reversed(frames))] += 1
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+
+    try:
+        yield stacks
+    finally:
+        done.set()
+        sampler.join()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(path, "w") as file:
+            file.writelines(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def read_samples(path: Path) -> Counter[str]:
+    stacks = Counter[str]()
+
+    with open(path) as file:
+        for line in file:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            stacks[stack] += int(count)
+
+    return stacks
+
+
+def format_samples(day: Day, part: str, path: Path, limit: int = TOP_FUNCTIONS) -> list[str]:
+    """The sample count and the functions most often on top of the stack, i.e. running themselves"""
+    stacks = read_samples(path)
+
+    # Blocks shorter than the interval have nothing worth listing
+    if not (total := sum(stacks.values())):
+        return []
+
+    lines = [f"{day.name:<12} {part:<10} {total} samples {path}"]
+
+    leaves = Counter[str]()
+
+    for stack, count in stacks.items():
+        leaves[stack.rpartition(";")[2]] += count
+
+    for name, count in leaves.most_common(limit):
+        lines.append(f"{'':<12} {'':<10} {count / total:>9.1%} own  {name}")
+
+    return lines
@@ -0,0 +1,180 @@
+import math
+import statistics
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional, Sequence
+
+from aoc.bench import DayBenchmark, benchmark_day
+from aoc.days import Day
+from aoc.runner import describe
+from aoc.stress import generator_module
+
+CURVES: dict[str, Callable[[float], float]] = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log(n),
+    "n^2": lambda n: n**2,
+    "n^2 log n": lambda n: n**2 * math.log(n),
+    "n^3": lambda n: n**3,
+}
+
+# Sizes that run faster than this are mostly fixed overhead and left out of the fit
+MIN_FIT_SECONDS = 0.001
+MIN_FIT_SIZES = 3
+
+# How much steeper than its expected curve a part may grow before it is flagged
+TOLERANCE = 0.25
+
+
+@dataclass
+class ScalingFit:
+    part: str
+    timings: list[tuple[int, float]]  # (scale, median seconds) of every size that ran
+    expected: Optional[str] = None
+    exponent: Optional[float] = None  # None when too few sizes were slow enough to fit
+    curve: Optional[str] = None
+    expected_exponent: Optional[float] = None
+
+    @property
+    def worse_than_expected(self) -> bool:
+        return (
+            self.exponent is not None
+            and self.expected_exponent is not None
+            and self.exponent > self.expected_exponent + TOLERANCE
+        )
+
+
+@dataclass
+class DayScaling:
+    day: Day
+    benchmarks: list[DayBenchmark] = field(default_factory=list[DayBenchmark])
+    fits: list[ScalingFit] = field(default_factory=list[ScalingFit])
+    error: Optional[str] = None
+
+
+def log_slope(sizes: Sequence[float], values: Sequence[float]) -> float:
+    """Least squares slope of log(value) against log(size), i.e. the exponent of a power law"""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(value) for value in values]
+    x_mean, y_mean = statistics.fmean(xs), statistics.fmean(ys)
+
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum((x - x_mean) ** 2 for x in xs)
+
+
+def fit(part: str, timings: list[tuple[int, float]], expected: Optional[str] = None) -> ScalingFit:
+    """Fits a part's median times to each candidate curve and estimates its exponent.
+
+    The best curve is the one whose constant factor varies least across sizes,
+    measured in log space so that every size weighs the same.
+    """
+    if expected is not None and expected not in CURVES:
+        raise ValueError(f"Unknown complexity {expected!r}, expected one of {', '.join(CURVES)}")
+
+    result = ScalingFit(part, timings, expected)
+    usable = [(size, seconds) for size, seconds in timings if seconds >= MIN_FIT_SECONDS]
+
+    if len(usable) < MIN_FIT_SIZES:
+        return result
+
+    sizes = [size for size, _ in usable]
+    result.exponent = log_slope(sizes, [seconds for _, seconds in usable])
+    result.curve = min(
+        CURVES,
+        key=lambda curve: statistics.pvariance(
+            [math.log(seconds / CURVES[curve](size)) for size, seconds in usable]
+        ),
+    )
+
+    # The local slope of n log n and friends depends on the sizes, so compare over the same ones
+    if expected is not None:
+        result.expected_exponent = log_slope(sizes, [CURVES[expected](size) for size in sizes])
+
+    return result
+
+
+def expected_complexity(day: Day) -> dict[str, str]:
+    """The day's `COMPLEXITY` from its generate.py, a curve name for every part or a dict of part -> curve"""
+    module = generator_module(day)
+    complexity = getattr(module, "COMPLEXITY", None)
+
+    if complexity is None:
+        return {}
+    elif isinstance(complexity, str):
+        return {"*": complexity}
+
+    return dict(complexity)
+
+
+def scaling_day(
+    day: Day,
+    parts: Optional[Iterable[str]] = None,
+    start: int = 100,
+    factor: int = 2,
+    steps: int = 6,
+    repeats: int = 3,
+    max_seconds: float = 10.0,
+    seed: int = 0,
+) -> DayScaling:
+    """Benchmarks a day on generated inputs of geometrically growing scale and fits each part's growth.
+
+    Growing stops after the first size whose parts take longer than
+    `max_seconds` in total, so a day that scales badly doesn't run for hours.
+    """
+    scaling = DayScaling(day)
+    parts = list(parts) if parts else None
+
+    try:
+        expected = expected_complexity(day)
+    except Exception as e:
+        scaling.error = describe(e)
+        return scaling
+
+    for step in range(steps):
+        benchmark = benchmark_day(day, parts, warmup=0, repeats=repeats, scale=start * factor**step, seed=seed)
+        scaling.benchmarks.append(benchmark)
+
+        if benchmark.error is not None:
+            scaling.error = f"{benchmark.name}: {benchmark.error}"
+            break
+
+        if sum(part.median for part in benchmark.parts.values() if part.samples) > max_seconds:
+            break
+
+    names = dict.fromkeys(name for benchmark in scaling.benchmarks for name in benchmark.parts)
+
+    for name in names:
+        timings = [
+            (benchmark.scale, part.median)
+            for benchmark in scaling.benchmarks
+            if benchmark.scale is not None and (part := benchmark.parts.get(name)) is not None and part.samples
+        ]
+
+        try:
+            scaling.fits.append(fit(name, timings, expected.get(name, expected.get("*"))))
+        except ValueError as e:
+            scaling.error = str(e)
+
+    return scaling
+
+
+def format_scaling(scaling: DayScaling) -> list[str]:
+    name = scaling.day.name
+    lines = list[str]()
+
+    for result in scaling.fits:
+        if result.exponent is None:
+            line = f"{name:<12} {result.part:<10} too fast to fit"
+        else:
+            line = f"{name:<12} {result.part:<10} exponent {result.exponent:>5.2f}  fits {result.curve:<10}"
+
+        if result.expected is not None:
+            line += f"  expected {result.expected}"
+
+        if result.worse_than_expected:
+            line += "  WORSE THAN EXPECTED"
+
+        lines.append(line)
+        lines.append(f"{'':<12} {'':<10} " + "  ".join(f"{size}: {seconds:.4f}s" for size, seconds in result.timings))
+
+    if scaling.error is not None:
+        lines.append(f"{name:<12} {'error':<10} {scaling.error}")
+
+    return lines
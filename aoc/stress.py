@@ -0,0 +1,69 @@
+import importlib.util
+import os
+import random
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterable, Optional
+
+from aoc.days import ROOT, Day
+from aoc.inputs import open_text
+
+STRESS_DIR = ROOT / ".aoc" / "stress"
+GENERATOR_FILE = "generate.py"
+
+Generator = Callable[[int, random.Random], Iterable[str]]
+
+
+def generator_path(day: Day) -> Path:
+    return day.path.parent / GENERATOR_FILE
+
+
+def generator_module(day: Day) -> Optional[ModuleType]:
+    if not (path := generator_path(day)).is_file():
+        return None
+
+    spec = importlib.util.spec_from_file_location(f"{day.module_name}_generate", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def generator(day: Day) -> Optional[Generator]:
+    """Loads `generate(scale, rng)` from the day's generate.py, if it has one"""
+    return module.generate if (module := generator_module(day)) is not None else None
+
+
+def stress_input(
+    day: Day,
+    scale: int,
+    seed: int = 0,
+    directory: Path = STRESS_DIR,
+    compression: Optional[str] = None,
+) -> Path:
+    """Returns the path of a generated input, writing it first if it doesn't exist yet.
+
+    Inputs are deterministic for a given scale and seed, so they are generated
+    once and reused; delete the directory after changing a generator. With
+    `compression` (gz, xz or zst) the input is compressed as it is written.
+    """
+    path = directory / f"{day.year}-day{day.day:02}-{scale}-{seed}.txt"
+
+    if compression is not None:
+        path = path.with_name(f"{path.name}.{compression}")
+
+    if path.exists():
+        return path
+    elif (generate := generator(day)) is None:
+        raise LookupError(f"{day.name} has no {GENERATOR_FILE}")
+
+    directory.mkdir(parents=True, exist_ok=True)
+    # Keeps the compression suffix last so the partial file is written compressed too
+    partial = path.with_name(f"{os.getpid()}.tmp.{path.name}")
+
+    with open_text(partial, "w") as file:
+        file.writelines(generate(scale, random.Random(seed)))
+
+    partial.replace(path)
+    return path
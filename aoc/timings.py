@@ -0,0 +1,34 @@
+import json
+from pathlib import Path
+from typing import Iterable
+
+from aoc.days import ROOT
+from aoc.runner import DayResult
+
+TIMINGS_PATH = ROOT / ".aoc" / "timings.json"
+
+
+def load_timings(path: Path = TIMINGS_PATH) -> dict[str, float]:
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def record_timings(results: Iterable[DayResult], path: Path = TIMINGS_PATH) -> None:
+    """Merges the wall time of each finished day into the timings file.
+
+    Days that failed or came from the result cache are skipped so a crash or a
+    cache hit doesn't make a heavy day look cheap.
+    """
+    timings = load_timings(path)
+
+    for result in results:
+        if result.ok and not result.cached:
+            timings[result.day.name] = result.seconds
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "w") as file:
+        json.dump(dict(sorted(timings.items())), file, indent=2)